@@ -8,8 +8,21 @@ __version__ = "0.1.0"
 __author__ = "Ryosuke Mondo"
 __license__ = "MIT"
 
-from .config import Config
-from .state import State, IterationState, CodeMetrics, TaskInfo
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .state import CodeMetrics, IterationState, State, TaskInfo
+
+# Public names resolved lazily (PEP 562) so that importing the package, or the
+# CLI through it, does not pay for pydantic until a model is actually used.
+_LAZY_ATTRS = {
+    "Config": ".config",
+    "State": ".state",
+    "IterationState": ".state",
+    "CodeMetrics": ".state",
+    "TaskInfo": ".state",
+}
 
 __all__ = [
     "Config",
@@ -19,3 +32,15 @@ __all__ = [
     "TaskInfo",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,110 +1,270 @@
 """Command-line interface for steer-driven-runner."""
 
+import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-import click
-from rich.console import Console
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NoReturn, Optional, Tuple
 
 from . import __version__
-from .config import Config
-from .feedback import FeedbackManager, FeedbackPriority, FeedbackType
-from .monitor import DevelopmentMonitor
-from .runner import AutonomousRunner
-
-
-console = Console()
-
-
-@click.group()
-@click.version_option(version=__version__)
-def cli() -> None:
-    """Steer-Driven Runner - Autonomous AI development driven by steering documents."""
-    pass
-
-
-@cli.command(name="run")
-@click.option(
-    "-i",
-    "--iterations",
-    type=int,
-    help="Maximum iterations (default: 50)",
-)
-@click.option(
-    "-c",
-    "--checkpoint",
-    type=int,
-    help="Checkpoint interval (default: 10)",
-)
-@click.option(
-    "-s",
-    "--spec",
-    type=str,
-    help="Specification name to run",
-)
-@click.option(
-    "-m",
-    "--model",
-    type=str,
-    help="Codex model (default: gpt-5.1-codex)",
-)
-@click.option(
-    "-p",
-    "--project-root",
-    type=click.Path(exists=True, file_okay=False, path_type=Path),
-    help="Project root directory (default: current directory)",
-)
-def run(
-    iterations: Optional[int],
-    checkpoint: Optional[int],
-    spec: Optional[str],
-    model: Optional[str],
-    project_root: Optional[Path],
-) -> None:
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Option tables map each flag to (destination keyword, value converter).
+OptionSpec = Dict[str, Tuple[str, Callable[[str], Any]]]
+
+
+RUN_USAGE = """Usage: steer-run [OPTIONS]
+
+  Run autonomous development iterations.
+
+Options:
+  -i, --iterations INTEGER  Maximum iterations (default: 50)
+  -c, --checkpoint INTEGER  Checkpoint interval (default: 10)
+  -s, --spec TEXT           Specification name to run
+  -m, --model TEXT          Codex model (default: gpt-5.1-codex)
+  -p, --project-root PATH   Project root directory (default: current directory)
+  -h, --help                Show this message and exit."""
+
+MONITOR_USAGE = """Usage: steer-monitor [OPTIONS]
+
+  Monitor autonomous development progress in real-time.
+
+Options:
+  -p, --project-root PATH   Project root directory (default: current directory)
+  -r, --refresh-rate FLOAT  Refresh rate in seconds (default: 2.0)
+  -h, --help                Show this message and exit."""
+
+FEEDBACK_USAGE = """Usage: steer-feedback [OPTIONS] MESSAGE
+
+  Post async feedback for the AI agent to process.
+
+  MESSAGE: The feedback message to post
+
+Options:
+  -p, --priority [LOW|MEDIUM|HIGH|CRITICAL]
+                                  Priority level (default: MEDIUM)
+  -t, --type [FEEDBACK|BUG|FEATURE|IMPROVEMENT|VISUAL]
+                                  Feedback type (default: FEEDBACK)
+  --project-root PATH             Project root directory (default: current directory)
+  -h, --help                      Show this message and exit."""
+
+INIT_USAGE = """Usage: steer-run init [OPTIONS]
+
+  Initialize a new project for steer-driven development.
+
+Options:
+  -p, --project-root PATH  Project root directory (default: current directory)
+  -h, --help               Show this message and exit."""
+
+MAIN_USAGE = """Usage: python -m steer_driven_runner [OPTIONS] COMMAND [ARGS]...
+
+  Steer-Driven Runner - Autonomous AI development driven by steering documents.
+
+Options:
+  --version   Show the version and exit.
+  -h, --help  Show this message and exit.
+
+Commands:
+  feedback  Post async feedback for the AI agent to process.
+  init      Initialize a new project for steer-driven development.
+  monitor   Monitor autonomous development progress in real-time.
+  run       Run autonomous development iterations."""
+
+
+@lru_cache(maxsize=1)
+def _console() -> "Console":
+    """Return the shared Rich console, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+# Markup used in CLI messages; stripped when output isn't a terminal
+_MARKUP_TAG = re.compile(r"\[/?(?:blue|green|yellow)\]")
+
+
+def _echo(text: str) -> None:
+    """Emit a block of CLI output in one write.
+
+    Rich renders the markup on a terminal; otherwise the tags are stripped
+    and the text goes straight to stdout without loading Rich.
+    """
+    if sys.stdout.isatty():
+        _console().print(text)
+    else:
+        sys.stdout.write(_MARKUP_TAG.sub("", text) + "\n")
+
+
+def _usage_error(usage: str, message: str) -> NoReturn:
+    """Print usage and an error message to stderr, then exit with status 2."""
+    sys.stderr.write(f"{usage.splitlines()[0]}\nTry '--help' for help.\n\nError: {message}\n")
+    raise SystemExit(2)
+
+
+def _integer(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{value!r} is not a valid integer.") from None
+
+
+def _float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"{value!r} is not a valid float.") from None
+
+
+def _choice(*choices: str) -> Callable[[str], str]:
+    """Build a case-insensitive choice converter returning the canonical choice."""
+
+    def convert(value: str) -> str:
+        upper = value.upper()
+        if upper not in choices:
+            options = ", ".join(repr(c) for c in choices)
+            raise ValueError(f"{value!r} is not one of {options}.")
+        return upper
+
+    return convert
+
+
+def _directory(must_exist: bool) -> Callable[[str], Path]:
+    """Build a converter for directory arguments."""
+
+    def convert(value: str) -> Path:
+        path = Path(value)
+        if path.is_file():
+            raise ValueError(f"Directory {value!r} is a file.")
+        if must_exist and not path.is_dir():
+            raise ValueError(f"Directory {value!r} does not exist.")
+        return path
+
+    return convert
+
+
+def _parse_args(
+    argv: List[str], options: OptionSpec, usage: str, nargs: int = 0
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Parse command-line flags in a single pass.
+
+    Args:
+        argv: Arguments following the command name
+        options: Flag table for the command
+        usage: Usage text shown for --help and errors
+        nargs: Number of required positional arguments
+
+    Returns:
+        Tuple of (parsed option values, positional arguments)
+    """
+    values: Dict[str, Any] = {}
+    positional: List[str] = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg in ("-h", "--help"):
+            print(usage)
+            raise SystemExit(0)
+        if arg == "--":
+            positional.extend(argv[i:])
+            break
+        if arg == "-" or not arg.startswith("-"):
+            positional.append(arg)
+            continue
+
+        flag, has_value, value = arg.partition("=")
+        if flag not in options and not arg.startswith("--") and arg[:2] in options:
+            # Short flag with attached value, e.g. -i50
+            flag, has_value, value = arg[:2], "x", arg[2:]
+        if flag not in options:
+            _usage_error(usage, f"No such option: {flag}")
+        if not has_value:
+            if i >= len(argv):
+                _usage_error(usage, f"Option '{flag}' requires an argument.")
+            value = argv[i]
+            i += 1
+
+        dest, convert = options[flag]
+        try:
+            values[dest] = convert(value)
+        except ValueError as e:
+            _usage_error(usage, f"Invalid value for '{flag}': {e}")
+
+    if len(positional) < nargs:
+        _usage_error(usage, "Missing argument 'MESSAGE'.")
+    if len(positional) > nargs:
+        _usage_error(usage, f"Got unexpected extra argument ({positional[nargs]})")
+    return values, positional
+
+
+_PROJECT_ROOT_OPTION = ("project_root", _directory(must_exist=True))
+
+_RUN_OPTIONS: OptionSpec = {
+    "-i": ("max_iterations", _integer),
+    "--iterations": ("max_iterations", _integer),
+    "-c": ("checkpoint_interval", _integer),
+    "--checkpoint": ("checkpoint_interval", _integer),
+    "-s": ("spec_name", str),
+    "--spec": ("spec_name", str),
+    "-m": ("codex_model", str),
+    "--model": ("codex_model", str),
+    "-p": _PROJECT_ROOT_OPTION,
+    "--project-root": _PROJECT_ROOT_OPTION,
+}
+
+_MONITOR_OPTIONS: OptionSpec = {
+    "-p": _PROJECT_ROOT_OPTION,
+    "--project-root": _PROJECT_ROOT_OPTION,
+    "-r": ("monitor_refresh_rate", _float),
+    "--refresh-rate": ("monitor_refresh_rate", _float),
+}
+
+_PRIORITY_OPTION = ("priority", _choice("LOW", "MEDIUM", "HIGH", "CRITICAL"))
+_TYPE_OPTION = ("feedback_type", _choice("FEEDBACK", "BUG", "FEATURE", "IMPROVEMENT", "VISUAL"))
+
+_FEEDBACK_OPTIONS: OptionSpec = {
+    "-p": _PRIORITY_OPTION,
+    "--priority": _PRIORITY_OPTION,
+    "-t": _TYPE_OPTION,
+    "--type": _TYPE_OPTION,
+    "--project-root": _PROJECT_ROOT_OPTION,
+}
+
+_INIT_OPTIONS: OptionSpec = {
+    "-p": ("project_root", _directory(must_exist=False)),
+    "--project-root": ("project_root", _directory(must_exist=False)),
+}
+
+
+def run(argv: Optional[List[str]] = None) -> None:
     """Run autonomous development iterations."""
     # Build config from CLI args and env
-    config_kwargs = {}
+    config_kwargs, _ = _parse_args(sys.argv[1:] if argv is None else argv, _RUN_OPTIONS, RUN_USAGE)
 
-    if iterations is not None:
-        config_kwargs["max_iterations"] = iterations
-    if checkpoint is not None:
-        config_kwargs["checkpoint_interval"] = checkpoint
-    if spec is not None:
-        config_kwargs["spec_name"] = spec
-    if model is not None:
-        config_kwargs["codex_model"] = model
-    if project_root is not None:
-        config_kwargs["project_root"] = project_root
+    from .config import Config
+    from .runner import AutonomousRunner
 
-    config = Config(**config_kwargs)
+    config = Config.from_cli(**config_kwargs)
 
     runner = AutonomousRunner(config)
     exit_code = runner.run()
     raise SystemExit(exit_code)
 
 
-@cli.command(name="monitor")
-@click.option(
-    "-p",
-    "--project-root",
-    type=click.Path(exists=True, file_okay=False, path_type=Path),
-    help="Project root directory (default: current directory)",
-)
-@click.option(
-    "-r",
-    "--refresh-rate",
-    type=float,
-    default=2.0,
-    help="Refresh rate in seconds (default: 2.0)",
-)
-def monitor(project_root: Optional[Path], refresh_rate: float) -> None:
+def monitor(argv: Optional[List[str]] = None) -> None:
     """Monitor autonomous development progress in real-time."""
-    config_kwargs = {"monitor_refresh_rate": refresh_rate}
+    options, _ = _parse_args(
+        sys.argv[1:] if argv is None else argv, _MONITOR_OPTIONS, MONITOR_USAGE
+    )
+    config_kwargs = {"monitor_refresh_rate": 2.0, **options}
 
-    if project_root is not None:
-        config_kwargs["project_root"] = project_root
+    from .config import Config
+    from .monitor import DevelopmentMonitor
 
-    config = Config(**config_kwargs)
+    config = Config.from_cli(**config_kwargs)
+    console = _console()
 
     console.print("Starting Steer-Driven Runner Monitor...")
     console.print(f"Project: {config.project_root.name}")
@@ -119,76 +279,54 @@ def monitor(project_root: Optional[Path], refresh_rate: float) -> None:
     dev_monitor.run()
 
 
-@cli.command(name="feedback")
-@click.argument("message")
-@click.option(
-    "-p",
-    "--priority",
-    type=click.Choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"], case_sensitive=False),
-    default="MEDIUM",
-    help="Priority level (default: MEDIUM)",
-)
-@click.option(
-    "-t",
-    "--type",
-    "feedback_type",
-    type=click.Choice(["FEEDBACK", "BUG", "FEATURE", "IMPROVEMENT", "VISUAL"], case_sensitive=False),
-    default="FEEDBACK",
-    help="Feedback type (default: FEEDBACK)",
-)
-@click.option(
-    "--project-root",
-    type=click.Path(exists=True, file_okay=False, path_type=Path),
-    help="Project root directory (default: current directory)",
-)
-def feedback(
-    message: str,
-    priority: str,
-    feedback_type: str,
-    project_root: Optional[Path],
-) -> None:
+def feedback(argv: Optional[List[str]] = None) -> None:
     """Post async feedback for the AI agent to process.
 
     MESSAGE: The feedback message to post
     """
+    options, (message,) = _parse_args(
+        sys.argv[1:] if argv is None else argv, _FEEDBACK_OPTIONS, FEEDBACK_USAGE, nargs=1
+    )
+    priority = options.get("priority", "MEDIUM")
+    feedback_type = options.get("feedback_type", "FEEDBACK")
+
+    from .config import Config
+    from .feedback import FEEDBACK_TYPES, PRIORITIES, FeedbackManager
+
     config_kwargs = {}
-    if project_root is not None:
-        config_kwargs["project_root"] = project_root
+    if "project_root" in options:
+        config_kwargs["project_root"] = options["project_root"]
 
-    config = Config(**config_kwargs)
+    config = Config.from_cli(**config_kwargs)
     manager = FeedbackManager(config.project_root)
 
-    # Convert string to enum
-    priority_enum = FeedbackPriority[priority.upper()]
-    type_enum = FeedbackType[feedback_type.upper()]
+    # Convert string to enum (already upper-cased and validated by the parser)
+    priority_enum = PRIORITIES[priority]
+    type_enum = FEEDBACK_TYPES[feedback_type]
 
     pending_file = manager.post_feedback(message, priority_enum, type_enum)
 
-    console.print("✓ Feedback posted successfully!", style="green")
-    console.print()
-    console.print(f"[blue]Feedback location:[/blue] {pending_file}")
-    console.print(f"[blue]Priority:[/blue] {priority}")
-    console.print(f"[blue]Type:[/blue] {feedback_type}")
-    console.print()
-    console.print("[yellow]Note:[/yellow] AI agent will read this feedback on the next iteration.")
-    console.print("It will consider your feedback when determining what to implement next.")
-    console.print()
-    console.print("[blue]To view pending feedback:[/blue]")
-    console.print(f"  cat {pending_file}")
-
-
-@cli.command(name="init")
-@click.option(
-    "-p",
-    "--project-root",
-    type=click.Path(file_okay=False, path_type=Path),
-    default=Path.cwd(),
-    help="Project root directory (default: current directory)",
-)
-def init(project_root: Path) -> None:
+    _echo(
+        f"""[green]✓ Feedback posted successfully![/green]
+
+[blue]Feedback location:[/blue] {pending_file}
+[blue]Priority:[/blue] {priority}
+[blue]Type:[/blue] {feedback_type}
+
+[yellow]Note:[/yellow] AI agent will read this feedback on the next iteration.
+It will consider your feedback when determining what to implement next.
+
+[blue]To view pending feedback:[/blue]
+  cat {pending_file}"""
+    )
+
+
+def init(argv: Optional[List[str]] = None) -> None:
     """Initialize a new project for steer-driven development."""
-    console.print(f"Initializing steer-driven development in: {project_root}")
-    console.print()
+    options, _ = _parse_args(sys.argv[1:] if argv is None else argv, _INIT_OPTIONS, INIT_USAGE)
+    project_root: Path = options.get("project_root", Path.cwd())
+
+    lines = [f"Initializing steer-driven development in: {project_root}", ""]
 
     # Create directory structure
     spec_workflow = project_root / ".spec-workflow"
@@ -196,9 +334,13 @@ def init(project_root: Path) -> None:
     feedback_dir = spec_workflow / "feedback"
     monitor_dir = spec_workflow / "monitor"
 
+    # Stat before creating: the directories usually exist on re-runs
+    if not spec_workflow.is_dir():
+        spec_workflow.mkdir(parents=True, exist_ok=True)
     for directory in [steering_dir, feedback_dir, monitor_dir]:
-        directory.mkdir(parents=True, exist_ok=True)
-        console.print(f"✓ Created: {directory.relative_to(project_root)}")
+        if not directory.is_dir():
+            directory.mkdir(exist_ok=True)
+        lines.append(f"✓ Created: {directory.relative_to(project_root)}")
 
     # Create template steering documents
     product_md = steering_dir / "product.md"
@@ -215,7 +357,7 @@ def init(project_root: Path) -> None:
 ## User Stories
 - As a user, I want to...
 """)
-        console.print(f"✓ Created: {product_md.relative_to(project_root)}")
+        lines.append(f"✓ Created: {product_md.relative_to(project_root)}")
 
     design_md = steering_dir / "design.md"
     if not design_md.exists():
@@ -227,7 +369,7 @@ def init(project_root: Path) -> None:
 ## UI/UX
 [Describe UI/UX design]
 """)
-        console.print(f"✓ Created: {design_md.relative_to(project_root)}")
+        lines.append(f"✓ Created: {design_md.relative_to(project_root)}")
 
     tech_md = steering_dir / "tech.md"
     if not tech_md.exists():
@@ -241,7 +383,7 @@ def init(project_root: Path) -> None:
 - Test coverage: ≥80%
 - Linting: Enabled
 """)
-        console.print(f"✓ Created: {tech_md.relative_to(project_root)}")
+        lines.append(f"✓ Created: {tech_md.relative_to(project_root)}")
 
     # Create README
     readme = spec_workflow / "README.md"
@@ -267,21 +409,45 @@ steer-monitor
 steer-feedback "Add user authentication"
 ```
 """)
-        console.print(f"✓ Created: {readme.relative_to(project_root)}")
+        lines.append(f"✓ Created: {readme.relative_to(project_root)}")
+
+    lines += [
+        "",
+        "[green]✓ Initialization complete![/green]",
+        "",
+        "[blue]Next steps:[/blue]",
+        "1. Edit steering documents in .spec-workflow/steering/",
+        "2. Run: steer-run",
+        "3. Monitor: steer-monitor (in a separate terminal)",
+    ]
+    _echo("\n".join(lines))
+
 
-    console.print()
-    console.print("[green]✓ Initialization complete![/green]")
-    console.print()
-    console.print("[blue]Next steps:[/blue]")
-    console.print("1. Edit steering documents in .spec-workflow/steering/")
-    console.print("2. Run: steer-run")
-    console.print("3. Monitor: steer-monitor (in a separate terminal)")
+_COMMANDS: Dict[str, Callable[[Optional[List[str]]], None]] = {
+    "run": run,
+    "monitor": monitor,
+    "feedback": feedback,
+    "init": init,
+}
 
 
 # Convenience function for running via python -m
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point."""
-    cli()
+    argv = sys.argv[1:] if argv is None else argv
+    cmd = argv[0] if argv else "--help"
+
+    if cmd in ("-h", "--help"):
+        print(MAIN_USAGE)
+        return
+    if cmd == "--version":
+        print(f"steer-driven-runner, version {__version__}")
+        return
+
+    handler = _COMMANDS.get(cmd)
+    if handler is None:
+        _usage_error(MAIN_USAGE, f"No such command '{cmd}'.")
+    handler(argv[1:])
 
 
 if __name__ == "__main__":
@@ -1,87 +1,140 @@
 """Configuration management for steer-driven-runner."""
 
+import os
+import re
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Optional
 
-from pydantic import Field
-from pydantic_settings import BaseSettings
+ENV_PREFIX = "STEER_"
+ENV_FILE = ".env"
 
 
-class Config(BaseSettings):
+@dataclass(frozen=True)
+class Config:
     """Configuration for autonomous development runner."""
 
     # Runner settings
-    max_iterations: int = Field(default=50, description="Maximum number of iterations")
-    checkpoint_interval: int = Field(
-        default=10, description="Checkpoint interval for human review"
+    max_iterations: int = field(
+        default=50, metadata={"description": "Maximum number of iterations"}
+    )
+    checkpoint_interval: int = field(
+        default=10, metadata={"description": "Checkpoint interval for human review"}
+    )
+    spec_name: Optional[str] = field(
+        default=None, metadata={"description": "Specification name to run"}
     )
-    spec_name: Optional[str] = Field(default=None, description="Specification name to run")
 
     # Codex/AI settings
-    codex_cmd: str = Field(default="codex", description="Codex command")
-    codex_model: str = Field(
+    codex_cmd: str = field(default="codex", metadata={"description": "Codex command"})
+    codex_model: str = field(
         default="gpt-5.1-codex",
-        description="Codex model (gpt-5.1-codex-max, gpt-5.1-codex, gpt-5.1-codex-mini, gpt-5-codex)",
+        metadata={
+            "description": (
+                "Codex model (gpt-5.1-codex-max, gpt-5.1-codex, gpt-5.1-codex-mini, gpt-5-codex)"
+            )
+        },
     )
-    codex_flags: str = Field(
+    codex_flags: str = field(
         default="--dangerously-bypass-approvals-and-sandbox",
-        description="Codex flags for automation",
+        metadata={"description": "Codex flags for automation"},
     )
-    max_tokens: int = Field(default=4000, description="Max tokens for Codex")
-    temperature: float = Field(default=0.7, description="Temperature for Codex")
+    max_tokens: int = field(default=4000, metadata={"description": "Max tokens for Codex"})
+    temperature: float = field(default=0.7, metadata={"description": "Temperature for Codex"})
 
     # Project paths
-    project_root: Path = Field(default=Path.cwd(), description="Project root directory")
+    project_root: Path = field(
+        default_factory=Path.cwd, metadata={"description": "Project root directory"}
+    )
 
     # Circuit breaker settings
-    max_no_progress: int = Field(
-        default=3, description="Max iterations without progress before stopping"
+    max_no_progress: int = field(
+        default=3, metadata={"description": "Max iterations without progress before stopping"}
     )
-    max_consecutive_failures: int = Field(
-        default=3, description="Max consecutive failures before escalation"
+    max_consecutive_failures: int = field(
+        default=3, metadata={"description": "Max consecutive failures before escalation"}
+    )
+
+    # Pause between successful iterations
+    inter_iteration_sleep: float = field(
+        default=0.0, metadata={"description": "Seconds to sleep between iterations"}
     )
 
     # Monitoring
-    monitor_refresh_rate: float = Field(
-        default=2.0, description="Monitor refresh rate in seconds"
+    monitor_refresh_rate: float = field(
+        default=2.0, metadata={"description": "Monitor refresh rate in seconds"}
     )
 
-    # Derived paths
-    @property
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build configuration from STEER_* environment variables and the .env file."""
+        return cls.from_cli()
+
+    @classmethod
+    def from_cli(cls, **overrides: Any) -> "Config":
+        """Build configuration from the environment, with CLI overrides taking precedence.
+
+        Args:
+            **overrides: Field values given on the command line
+
+        Returns:
+            Config object
+
+        Raises:
+            ValueError: If an environment value cannot be converted to its field type
+        """
+        values: Dict[str, Any] = {}
+        for key, raw in _read_env().items():
+            convert = _COERCE.get(key)
+            if convert is None:
+                continue
+            try:
+                values[key] = convert(raw)
+            except ValueError:
+                raise ValueError(
+                    f"Invalid value for {ENV_PREFIX}{key.upper()}: {raw!r}"
+                ) from None
+        values.update(overrides)
+        return cls(**values)
+
+    # Derived paths (project_root is immutable, so each is computed once)
+    @cached_property
     def spec_dir(self) -> Optional[Path]:
         """Get specification directory."""
         if self.spec_name:
             return self.project_root / ".spec-workflow" / "specs" / self.spec_name
         return None
 
-    @property
+    @cached_property
     def tasks_file(self) -> Optional[Path]:
         """Get tasks file path."""
-        if self.spec_dir:
-            return self.spec_dir / "tasks.md"
+        spec_dir = self.spec_dir
+        if spec_dir:
+            return spec_dir / "tasks.md"
         return None
 
-    @property
+    @cached_property
     def steering_dir(self) -> Path:
         """Get steering documents directory."""
         return self.project_root / ".spec-workflow" / "steering"
 
-    @property
+    @cached_property
     def feedback_file(self) -> Path:
         """Get pending feedback file path."""
         return self.project_root / ".spec-workflow" / "feedback" / "pending.md"
 
-    @property
+    @cached_property
     def monitor_dir(self) -> Path:
         """Get monitor state directory."""
         return self.project_root / ".spec-workflow" / "monitor"
 
-    @property
+    @cached_property
     def state_file(self) -> Path:
         """Get state file path."""
         return self.monitor_dir / "state.json"
 
-    @property
+    @cached_property
     def log_file(self) -> Path:
         """Get log file path."""
         return self.project_root / "autonomous-dev.log"
@@ -91,13 +144,77 @@ class Config(BaseSettings):
         """Check if running in steering-driven mode (no spec name or tasks.md missing)."""
         if not self.spec_name:
             return True
-        if self.tasks_file and self.tasks_file.exists():
+        tasks_file = self.tasks_file
+        if tasks_file and os.path.exists(tasks_file):
             return False
         return True
 
-    class Config:
-        """Pydantic config."""
 
-        env_prefix = "STEER_"
-        env_file = ".env"
-        case_sensitive = False
+def _optional_str(value: str) -> Optional[str]:
+    return value or None
+
+
+_COERCE: Dict[str, Callable[[str], Any]] = {
+    "max_iterations": int,
+    "checkpoint_interval": int,
+    "spec_name": _optional_str,
+    "codex_cmd": str,
+    "codex_model": str,
+    "codex_flags": str,
+    "max_tokens": int,
+    "temperature": float,
+    "project_root": Path,
+    "max_no_progress": int,
+    "max_consecutive_failures": int,
+    "inter_iteration_sleep": float,
+    "monitor_refresh_rate": float,
+}
+
+
+# Start of a trailing comment on an unquoted .env value
+_INLINE_COMMENT = re.compile(r"\s+#")
+
+
+def _read_env_file(path: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines from a dotenv file, ignoring blanks and comments.
+
+    Values may be quoted, which keeps any ``#`` inside them; an unquoted value
+    ends at a ``#`` preceded by whitespace.
+    """
+    values: Dict[str, str] = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.startswith("export "):
+                    line = line[len("export ") :]
+                key, sep, value = line.partition("=")
+                if not sep:
+                    continue
+                quoted = value.strip()
+                end = quoted.find(quoted[0], 1) if quoted[:1] in ("'", '"') else -1
+                if end != -1:
+                    value = quoted[1:end]
+                else:
+                    value = _INLINE_COMMENT.split(value, 1)[0].strip()
+                values[key.strip()] = value
+    except FileNotFoundError:
+        pass
+    return values
+
+
+def _read_env() -> Dict[str, str]:
+    """Collect STEER_* settings keyed by lower-case field name.
+
+    Environment variables take precedence over the .env file; names are
+    matched case-insensitively.
+    """
+    prefix_len = len(ENV_PREFIX)
+    values: Dict[str, str] = {}
+    for source in (_read_env_file(ENV_FILE), os.environ):
+        for key, value in source.items():
+            if key.upper().startswith(ENV_PREFIX):
+                values[key[prefix_len:].lower()] = value
+    return values
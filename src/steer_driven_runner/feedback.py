@@ -1,10 +1,29 @@
 """Async feedback system for human-AI collaboration."""
 
-from datetime import datetime
+import os
+import time
 from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+_ENTRY_SEPARATOR = "\n\n---\n\n"
+
+# Markdown layout of one entry in pending.md
+_ENTRY_TEMPLATE = (
+    "{separator}"
+    "## {message}\n"
+    "**Date:** {timestamp}\n"
+    "**Priority:** {priority}\n"
+    "**Type:** {feedback_type}\n"
+    "\n"
+    "**Description:**\n"
+    "{message}\n"
+    "\n"
+    "**Status:** PENDING (awaiting AI agent processing)\n"
+    "\n"
+    "**Posted by:** Human (async feedback)\n"
+)
+
 
 class FeedbackPriority(str, Enum):
     """Priority levels for feedback."""
@@ -25,9 +44,16 @@ class FeedbackType(str, Enum):
     VISUAL = "VISUAL"
 
 
+# Name -> member lookups for parsing CLI input without going through EnumMeta
+PRIORITIES = {priority.name: priority for priority in FeedbackPriority}
+FEEDBACK_TYPES = {feedback_type.name: feedback_type for feedback_type in FeedbackType}
+
+
 class FeedbackManager:
     """Manager for async feedback system."""
 
+    __slots__ = ("project_root", "feedback_dir", "pending_file", "archive_dir")
+
     def __init__(self, project_root: Path):
         """Initialize feedback manager.
 
@@ -55,29 +81,28 @@ class FeedbackManager:
         Returns:
             Path to the pending feedback file
         """
-        self.feedback_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Check if pending.md already exists
-        separator = ""
-        if self.pending_file.exists():
-            separator = "\n\n---\n\n"
-
-        # Append feedback
-        with open(self.pending_file, "a") as f:
-            f.write(separator)
-            f.write(f"## {message}\n")
-            f.write(f"**Date:** {timestamp}\n")
-            f.write(f"**Priority:** {priority.value}\n")
-            f.write(f"**Type:** {feedback_type.value}\n")
-            f.write("\n")
-            f.write("**Description:**\n")
-            f.write(f"{message}\n")
-            f.write("\n")
-            f.write("**Status:** PENDING (awaiting AI agent processing)\n")
-            f.write("\n")
-            f.write("**Posted by:** Human (async feedback)\n")
+        if not self.feedback_dir.is_dir():
+            self.feedback_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+
+        # Append each entry with a single write so entry bodies don't interleave.
+        # The separator is picked before the write, so two concurrent first
+        # posts can still end up without one between them.
+        fd = os.open(self.pending_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            # Separate from existing feedback if pending.md is not empty
+            separator = _ENTRY_SEPARATOR if os.fstat(fd).st_size else ""
+            entry = _ENTRY_TEMPLATE.format(
+                separator=separator,
+                message=message,
+                timestamp=timestamp,
+                priority=priority.value,
+                feedback_type=feedback_type.value,
+            )
+            os.write(fd, entry.encode("utf-8"))
+        finally:
+            os.close(fd)
 
         return self.pending_file
 
@@ -95,27 +120,34 @@ class FeedbackManager:
         Returns:
             Feedback content or None if no pending feedback
         """
-        if not self.has_pending_feedback():
+        try:
+            with open(self.pending_file, "rb") as f:
+                return f.read().decode("utf-8")
+        except FileNotFoundError:
             return None
 
-        with open(self.pending_file, "r") as f:
-            return f.read()
-
     def archive_feedback(self) -> Optional[Path]:
         """Archive processed feedback.
 
         Returns:
             Path to archived file or None if no pending feedback
         """
-        if not self.has_pending_feedback():
-            return None
-
-        self.archive_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y-%m-%d-%H%M%S")
-        archive_file = self.archive_dir / f"{timestamp}.md"
-
-        self.pending_file.rename(archive_file)
+        # Nanosecond suffix keeps names unique and sortable within the same second
+        seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+        timestamp = time.strftime("%Y-%m-%d-%H%M%S", time.localtime(seconds))
+        archive_file = self.archive_dir / f"{timestamp}-{nanos:09d}.md"
+
+        try:
+            os.replace(self.pending_file, archive_file)
+        except FileNotFoundError:
+            if self.archive_dir.is_dir() or not self.pending_file.exists():
+                # Nothing pending
+                return None
+            self.archive_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(self.pending_file, archive_file)
+            except FileNotFoundError:
+                return None
         return archive_file
 
     def clear_feedback(self) -> bool:
@@ -124,7 +156,8 @@ class FeedbackManager:
         Returns:
             True if feedback was cleared
         """
-        if self.has_pending_feedback():
+        try:
             self.pending_file.unlink()
-            return True
-        return False
+        except FileNotFoundError:
+            return False
+        return True
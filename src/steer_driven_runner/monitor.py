@@ -1,8 +1,11 @@
 """Real-time monitoring dashboard for autonomous development."""
 
+import os
 import time
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Tuple
 
 from rich import box
 from rich.console import Console
@@ -15,10 +18,56 @@ from rich.text import Text
 from .config import Config
 from .state import RunStatus, State, TaskStatus
 
+_STATUS_COLORS: Mapping[RunStatus, str] = MappingProxyType(
+    {
+        RunStatus.RUNNING: "green",
+        RunStatus.WAITING: "yellow",
+        RunStatus.ERROR: "red",
+        RunStatus.STOPPED: "blue",
+    }
+)
+
+_TASK_COLORS: Mapping[TaskStatus, str] = MappingProxyType(
+    {
+        TaskStatus.PENDING: "yellow",
+        TaskStatus.IN_PROGRESS: "green",
+        TaskStatus.COMPLETED: "blue",
+        TaskStatus.ERROR: "red",
+    }
+)
+
+_PROGRESS_BAR_WIDTH = 30
+
+# Every bar the dashboard can draw at the default width, indexed by filled cells
+_PROGRESS_BARS = tuple(
+    f"[{'█' * filled}{'░' * (_PROGRESS_BAR_WIDTH - filled)}]"
+    for filled in range(_PROGRESS_BAR_WIDTH + 1)
+)
+
 
 class DevelopmentMonitor:
     """Real-time monitoring dashboard for autonomous development."""
 
+    __slots__ = (
+        "config",
+        "console",
+        "last_state",
+        "state_file",
+        "_cached_key",
+        "_cached_bytes",
+        "_cached_state",
+        "_waiting_state",
+        "_layout",
+        "_header",
+        "_iteration",
+        "_metrics",
+        "_task",
+        "_output",
+        "_footer",
+        "_sections",
+        "_last_signature",
+    )
+
     def __init__(self, config: Config):
         """Initialize the monitor.
 
@@ -28,19 +77,71 @@ class DevelopmentMonitor:
         self.config = config
         self.console = Console()
         self.last_state: Optional[State] = None
+        self.state_file: Path = config.state_file
+
+        # (inode, mtime_ns, size) and raw bytes of the state file when it was last parsed
+        self._cached_key: Optional[Tuple[int, int, int]] = None
+        self._cached_bytes: Optional[bytes] = None
+        self._cached_state: Optional[State] = None
+
+        # Shown until the runner writes its first state file
+        self._waiting_state = State.create_waiting(config.max_iterations)
+
+        # Persistent layout tree; run() repaints its sections in place
+        self._layout = self._build_layout()
+        self._header = self._layout["header"]
+        self._iteration = self._layout["iteration"]
+        self._metrics = self._layout["metrics"]
+        self._task = self._layout["task"]
+        self._output = self._layout["right"]
+        self._footer = self._layout["footer"]
+
+        # Sections repainted only when their part of the state changes
+        self._sections: Tuple[Tuple[Layout, Callable[[State], Panel]], ...] = (
+            (self._header, self.create_header_panel),
+            (self._iteration, self.create_iteration_panel),
+            (self._metrics, self.create_code_metrics_panel),
+            (self._task, self.create_current_task_panel),
+            (self._output, self.create_output_panel),
+        )
+        self._last_signature: Optional[Tuple[Any, ...]] = None
 
     def read_state(self) -> State:
         """Read current state from state file.
 
+        The file is only re-read when its inode, modification time or size changes,
+        and only re-parsed when its contents differ from the last read.
+
         Returns:
             Current state or a waiting state if file doesn't exist
         """
-        state = State.load(self.config.state_file)
-        if state:
-            return state
-
-        # Return waiting state if no state file exists
-        return State.create_waiting(self.config.max_iterations)
+        try:
+            st = os.stat(self.state_file)
+            # Saves replace the file, so a new inode catches same-size rewrites
+            # that land within the filesystem's timestamp granularity
+            key = (st.st_ino, st.st_mtime_ns, st.st_size)
+            if key == self._cached_key and self._cached_state is not None:
+                return self._cached_state
+            data = self.state_file.read_bytes()
+        except FileNotFoundError:
+            pass
+        else:
+            # A rewrite with identical content bumps mtime but needs no parse
+            state: Optional[State]
+            if data == self._cached_bytes and self._cached_state is not None:
+                state = self._cached_state
+            else:
+                state = State.loads(data)
+            self._cached_key = key if state else None
+            self._cached_bytes = data if state else None
+            self._cached_state = state
+            if state:
+                return state
+
+        # Return waiting state if no state file exists; only its timestamp changes
+        waiting_state = self._waiting_state
+        waiting_state.timestamp = datetime.now()
+        return waiting_state
 
     def create_header_panel(self, state: State) -> Panel:
         """Create header panel with title and status.
@@ -51,12 +152,7 @@ class DevelopmentMonitor:
         Returns:
             Header panel
         """
-        status_color = {
-            RunStatus.RUNNING: "green",
-            RunStatus.WAITING: "yellow",
-            RunStatus.ERROR: "red",
-            RunStatus.STOPPED: "blue",
-        }.get(state.status, "white")
+        status_color = _STATUS_COLORS.get(state.status, "white")
 
         title = Text("Steer-Driven Runner Monitor", style="bold cyan")
         status_text = Text(f"Status: {state.status.value.upper()}", style=f"bold {status_color}")
@@ -119,12 +215,7 @@ class DevelopmentMonitor:
         description = task.description
         task_status = task.status
 
-        status_color = {
-            TaskStatus.PENDING: "yellow",
-            TaskStatus.IN_PROGRESS: "green",
-            TaskStatus.COMPLETED: "blue",
-            TaskStatus.ERROR: "red",
-        }.get(task_status, "white")
+        status_color = _TASK_COLORS.get(task_status, "white")
 
         content = Text()
         content.append("Status: ", style="bold")
@@ -148,11 +239,10 @@ class DevelopmentMonitor:
         if not output:
             output = "[dim]No output yet...[/dim]"
 
-        # Truncate to last 10 lines
-        lines = output.split("\n")
+        # Truncate to last 10 lines, scanning only from the end of the output
+        lines = output.rsplit("\n", 10)
         if len(lines) > 10:
-            lines = lines[-10:]
-            output = "\n".join(lines)
+            output = "\n".join(lines[1:])
 
         return Panel(output, title="Recent Output", border_style="yellow")
 
@@ -165,9 +255,7 @@ class DevelopmentMonitor:
         Returns:
             Timestamp panel
         """
-        from datetime import datetime
-
-        timestamp = state.timestamp
+        timestamp = state.timestamp or datetime.now()
         time_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
         elapsed = (datetime.now() - timestamp).total_seconds()
         elapsed_str = f"({elapsed:.0f}s ago)"
@@ -186,17 +274,17 @@ class DevelopmentMonitor:
             Progress bar string
         """
         filled = int((percentage / 100) * width)
+        if width == _PROGRESS_BAR_WIDTH:
+            return _PROGRESS_BARS[min(width, max(0, filled))]
+
         empty = width - filled
         return f"[{'█' * filled}{'░' * empty}]"
 
-    def create_layout(self, state: State) -> Layout:
-        """Create the overall layout.
-
-        Args:
-            state: Current state
+    def _build_layout(self) -> Layout:
+        """Create the empty layout tree.
 
         Returns:
-            Layout object
+            Layout object with named, unfilled sections
         """
         layout = Layout()
 
@@ -217,6 +305,19 @@ class DevelopmentMonitor:
             Layout(name="task"),
         )
 
+        return layout
+
+    def create_layout(self, state: State) -> Layout:
+        """Create the overall layout.
+
+        Args:
+            state: Current state
+
+        Returns:
+            Layout object
+        """
+        layout = self._build_layout()
+
         # Right side is output
         layout["right"].update(self.create_output_panel(state))
 
@@ -229,18 +330,95 @@ class DevelopmentMonitor:
 
         return layout
 
+    @staticmethod
+    def _state_signature(state: State) -> Tuple[Any, ...]:
+        """Summarize the inputs of each section panel, in self._sections order.
+
+        Args:
+            state: Current state
+
+        Returns:
+            Tuple with one comparable entry per section
+        """
+        iteration = state.iteration
+        metrics = state.code_metrics
+        task = state.current_task
+        return (
+            state.status,
+            (iteration.current, iteration.specified),
+            (metrics.total_lines, metrics.file_count),
+            (task.status, task.description),
+            state.last_output,
+        )
+
+    def update_all(self, state: State) -> None:
+        """Repaint the persistent layout's sections whose inputs changed.
+
+        The footer is always repainted so that its elapsed time keeps ticking.
+
+        Args:
+            state: Current state
+        """
+        if state is not self.last_state:
+            signature = self._state_signature(state)
+            last_signature = self._last_signature
+            for index, (section, create_panel) in enumerate(self._sections):
+                if last_signature is None or signature[index] != last_signature[index]:
+                    section.update(create_panel(state))
+            self._last_signature = signature
+            self.last_state = state
+
+        self._footer.update(self.create_timestamp_panel(state))
+
+    def _watch_state_dir(self) -> Optional[Any]:
+        """Watch the state file's directory for completed writes.
+
+        Uses inotify (via the optional ``inotify_simple`` package) when
+        available; otherwise the monitor falls back to polling.
+
+        Returns:
+            INotify instance, or None if file watching is unavailable
+        """
+        try:
+            from inotify_simple import INotify, flags  # type: ignore[import-untyped]
+        except ImportError:
+            return None
+
+        try:
+            watcher = INotify()
+        except OSError:
+            # Out of inotify instances or descriptors
+            return None
+        try:
+            watcher.add_watch(str(self.state_file.parent), flags.CLOSE_WRITE | flags.MOVED_TO)
+        except OSError:
+            # Monitor directory doesn't exist yet
+            watcher.close()
+            return None
+        return watcher
+
     def run(self) -> None:
         """Run the monitoring dashboard."""
+        refresh_rate = self.config.monitor_refresh_rate
+        watcher = self._watch_state_dir()
+        self.update_all(self.read_state())
+
         try:
             with Live(
-                self.create_layout(self.read_state()),
-                refresh_per_second=1 / self.config.monitor_refresh_rate,
+                self._layout,
+                refresh_per_second=1 / refresh_rate,
                 console=self.console,
             ) as live:
                 while True:
-                    state = self.read_state()
-                    self.last_state = state
-                    live.update(self.create_layout(state))
-                    time.sleep(self.config.monitor_refresh_rate)
+                    if watcher is not None:
+                        # Wake on state file writes; the timeout keeps the footer ticking
+                        watcher.read(timeout=int(refresh_rate * 1000))
+                    else:
+                        time.sleep(refresh_rate)
+                    self.update_all(self.read_state())
+                    live.refresh()
         except KeyboardInterrupt:
             self.console.print("\n[yellow]Monitor stopped by user.[/yellow]")
+        finally:
+            if watcher is not None:
+                watcher.close()
@@ -1,18 +1,171 @@
 """Main autonomous development runner."""
 
+import atexit
+import codecs
 import logging
+import os
+import queue
+import re
+import shutil
 import subprocess
+import threading
 import time
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from hashlib import blake2b
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import IO, Dict, List, Optional, Tuple
 
-from rich.console import Console
+from rich import box
+from rich.console import Console, Group
 from rich.logging import RichHandler
+from rich.padding import Padding
+from rich.panel import Panel
+from rich.text import Text
 
 from .config import Config
 from .feedback import FeedbackManager
-from .state import RunStatus, State, TaskInfo, TaskStatus, collect_code_metrics, IterationState
+from .state import CodeMetrics, RunStatus, State, TaskStatus, collect_code_metrics
+
+
+# A task checkbox line in tasks.md: indentation, marker (" ", "-" or "x"), description
+_TASK_RE = re.compile(r"^([ \t]*)- \[([ x-])\](.*)$", re.MULTILINE)
+
+# A full SHA-1 or SHA-256 object name
+_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+
+# Seconds to wait before the first retry after a failed iteration, doubled per failure
+_FAILURE_BACKOFF = 2.0
+
+# Commits _walk_commits_between visits before deferring to `git rev-list`
+_MAX_COMMIT_WALK = 256
+
+# Seconds between stop-file checks and state heartbeats while Codex runs
+_CODEX_HEARTBEAT = 2.0
+
+# Trailing Codex output lines kept for the monitor's output panel, and the
+# characters kept of each (progress bars can emit long runs without a newline)
+_OUTPUT_TAIL_LINES = 10
+_OUTPUT_LINE_CHARS = 500
+
+# Line breaks in Codex output; a bare \r (spinners, progress bars) counts as one
+_LINE_BREAK_RE = re.compile(r"\r\n?|\n")
+
+# Seconds to keep reading output after Codex exits. Background processes it
+# started may hold the pipe open long after, so EOF is not waited for.
+_EXIT_GRACE = 0.5
+
+
+def _drain_pipe(pipe: IO[bytes], chunks: "queue.SimpleQueue[Optional[bytes]]") -> None:
+    """Forward output from pipe to chunks as it arrives, then None at EOF.
+
+    Runs on its own thread so the reader never needs select(), which does
+    not support pipes on Windows. The pipe is closed once drained.
+
+    Args:
+        pipe: Binary pipe to read from
+        chunks: Queue receiving each chunk read
+    """
+    fd = pipe.fileno()
+    with pipe:
+        while chunk := os.read(fd, 65536):
+            chunks.put(chunk)
+    chunks.put(None)
+
+
+def _wake_on_exit(
+    proc: "subprocess.Popen[bytes]", chunks: "queue.SimpleQueue[Optional[bytes]]"
+) -> None:
+    """Wait for proc to exit, then wake the output loop with an empty chunk.
+
+    Args:
+        proc: Process to wait for
+        chunks: Queue the output loop reads from
+    """
+    proc.wait()
+    chunks.put(b"")
+
+
+def _banner(*lines: str, style: str, trailing_blank: bool = True) -> Padding:
+    """Build a milestone banner: a bordered block of lines after a blank line.
+
+    Args:
+        *lines: Banner text, one entry per line
+        style: Text and border style
+        trailing_blank: Also leave a blank line after the banner
+
+    Returns:
+        Renderable printed with a single console.print call
+    """
+    panel = Panel(
+        Text("\n".join(lines), style=style), box=box.DOUBLE, border_style=style, expand=False
+    )
+    return Padding(panel, (1, 0, int(trailing_blank), 0))
+
+
+# Fixed banners, rendered once per run at most
+_START_BANNER = _banner("🤖 Steer-Driven Autonomous Runner", "AI-Driven Development", style="blue")
+_STOP_BANNER = _banner(
+    "🛑 STOP FILE DETECTED", "Graceful shutdown after current iteration", style="yellow"
+)
+_COMPLETE_BANNER = _banner(
+    "🎉 PROJECT COMPLETE!",
+    "All tasks done. Ready for review.",
+    style="green",
+    trailing_blank=False,
+)
+_MAX_ITERATIONS_BANNER = _banner(
+    "⚠️  MAX ITERATIONS REACHED", "Human review required before continuing.", style="yellow"
+)
+
+_RULE = "═" * 59
+
+_PROMPT_TEMPLATE = """# Autonomous Development Task - Iteration {iteration}
+
+## Current Status
+- **Iteration**: {iteration} of {max_iterations}
+- **Mode**: {mode_status}
+
+{feedback_section}
+{cleanup_section}
+
+## Instructions
+Read steering documents → Find next task → Implement → Test → Commit → Exit
+
+**BEGIN IMPLEMENTATION NOW**
+"""
+
+_FEEDBACK_TEMPLATE = """
+### ⚠️ IMPORTANT: Human Feedback Available
+
+The human has posted async feedback for you to consider:
+
+```
+{feedback_content}
+```
+
+**Instructions:**
+- CONSIDER this feedback when deciding what to implement
+- If you address the feedback, mention it in your commit message
+- After processing, this feedback will be archived
+- Feedback is advisory - you can continue with planned work if more urgent
+"""
+
+_CLEANUP_TEMPLATE = """
+## 🧹 Cleanup Before New Work
+The working tree is dirty. Review and commit before starting a new task.
+
+Dirty files (git status --short):
+```
+{dirty_preview}{more}
+```
+
+**Cleanup plan:**
+- Group related changes into semantic commits (e.g., api/web/tests).
+- Run relevant tests for each commit before pushing.
+- Only start new tasks once the workspace is clean or explain why cleanup was skipped.
+"""
 
 
 class AutonomousRunner:
@@ -25,14 +178,67 @@ class AutonomousRunner:
             config: Configuration object
         """
         self.config = config
-        self.console = Console()
-        self.feedback_manager = FeedbackManager(config.project_root)
-        self.logger = self._setup_logging()
 
         # Circuit breaker state
         self.consecutive_failures = 0
         self.no_progress_count = 0
 
+        # Last scan of tasks.md, keyed by its (mtime_ns, size)
+        self._tasks_key: Optional[Tuple[int, int]] = None
+        self._tasks_scan: Optional[Tuple[int, int, int, str]] = None
+
+        self._stop_file = str(config.project_root / "stop.txt")
+        self._git_dir = config.project_root / ".git"
+        self._git_batch: Optional[subprocess.Popen[bytes]] = None
+
+        # Codex argv up to the prompt, with the command resolved once. A relative
+        # path is taken from project_root, where Codex runs; a bare name from PATH.
+        codex_cmd = config.codex_cmd
+        if os.path.dirname(codex_cmd) and not os.path.isabs(codex_cmd):
+            codex_cmd = os.path.join(config.project_root, codex_cmd)
+        self._codex_path = shutil.which(codex_cmd)
+        self._codex_argv_prefix: List[str] = [
+            self._codex_path or config.codex_cmd,
+            "e",
+            *config.codex_flags.split(),
+            "--model",
+            config.codex_model,
+            "-c",
+            f"max_tokens={config.max_tokens}",
+            "-c",
+            f"temperature={config.temperature}",
+        ]
+
+        # Prompt templates per mode, and the last rendered feedback section
+        self._prompt_templates: Dict[bool, str] = {}
+        self._feedback_section: Tuple[Optional[str], str] = (None, "")
+
+        # Metrics from the last collection, reused by heartbeats during a Codex run
+        self._code_metrics: Optional[CodeMetrics] = None
+
+        # Digest of the last state written, excluding its timestamp
+        self._last_state_digest: Optional[bytes] = None
+
+    @cached_property
+    def console(self) -> Console:
+        """Console for runner output, created on first use."""
+        return Console()
+
+    @cached_property
+    def feedback_manager(self) -> FeedbackManager:
+        """Feedback manager for the project, created on first use."""
+        return FeedbackManager(self.config.project_root)
+
+    @cached_property
+    def logger(self) -> logging.Logger:
+        """Logger writing to the console and the log file, set up on first use."""
+        return self._setup_logging()
+
+    @cached_property
+    def _io_pool(self) -> ThreadPoolExecutor:
+        """Worker threads for git queries run alongside the iteration's other I/O."""
+        return ThreadPoolExecutor(max_workers=2, thread_name_prefix="steer-io")
+
     def _setup_logging(self) -> logging.Logger:
         """Set up logging with rich handler.
 
@@ -51,23 +257,21 @@ class AutonomousRunner:
 
     def _print_banner(self) -> None:
         """Print startup banner."""
-        self.console.print()
-        self.console.print("╔════════════════════════════════════════════════════════════╗", style="blue")
-        self.console.print("║          🤖 Steer-Driven Autonomous Runner                ║", style="blue")
-        self.console.print("║          AI-Driven Development                             ║", style="blue")
-        self.console.print("╚════════════════════════════════════════════════════════════╝", style="blue")
-        self.console.print()
-
-        self.console.print("📊 Configuration:", style="blue")
-        self.console.print(f"  Max iterations: {self.config.max_iterations}")
-        self.console.print(f"  Checkpoint interval: {self.config.checkpoint_interval}")
+        configuration = Text("📊 Configuration:\n", style="blue")
+        configuration.append(
+            f"  Max iterations: {self.config.max_iterations}\n"
+            f"  Checkpoint interval: {self.config.checkpoint_interval}\n"
+        )
         if self.config.spec_name:
-            self.console.print(f"  Spec: {self.config.spec_name}")
+            configuration.append(f"  Spec: {self.config.spec_name}\n")
         else:
-            self.console.print("  Mode: Steering-driven (no spec)", style="green")
-        self.console.print(f"  Project root: {self.config.project_root}")
-        self.console.print(f"  Log file: {self.config.log_file}")
-        self.console.print()
+            configuration.append("  Mode: Steering-driven (no spec)\n", style="green")
+        configuration.append(
+            f"  Project root: {self.config.project_root}\n"
+            f"  Log file: {self.config.log_file}\n"
+        )
+
+        self.console.print(Group(_START_BANNER, configuration))
 
     def _validate_environment(self) -> None:
         """Validate the environment before starting.
@@ -75,13 +279,15 @@ class AutonomousRunner:
         Raises:
             RuntimeError: If validation fails
         """
-        product_md = self.config.steering_dir / "product.md"
-        if not product_md.exists():
+        if not os.path.exists(os.path.join(self.config.steering_dir, "product.md")):
             raise RuntimeError(
                 f"Steering documents not found at {self.config.steering_dir}\n"
                 "Please ensure product.md, design.md, and tech.md exist."
             )
 
+        if self._codex_path is None:
+            raise RuntimeError(f"Codex command not found: {self.config.codex_cmd}")
+
         # Determine mode
         if self.config.is_steering_driven:
             self.logger.info("✓ Running in steering-driven mode")
@@ -95,41 +301,100 @@ class AutonomousRunner:
         Returns:
             True if should stop
         """
-        stop_file = self.config.project_root / "stop.txt"
-        if stop_file.exists():
-            self.console.print()
-            self.console.print("╔════════════════════════════════════════════════════════╗", style="yellow")
-            self.console.print("║  🛑 STOP FILE DETECTED                                ║", style="yellow")
-            self.console.print("║  Graceful shutdown after current iteration           ║", style="yellow")
-            self.console.print("╚════════════════════════════════════════════════════════╝", style="yellow")
-            self.console.print()
+        # Checked every iteration, so only the path string is cached, never the result
+        stop_file = self._stop_file
+        if os.path.exists(stop_file):
+            self.console.print(_STOP_BANNER)
             self.logger.info(f"Found: {stop_file}")
             self.logger.info("Removing stop.txt for next run...")
-            stop_file.unlink()
+            os.unlink(stop_file)
             return True
         return False
 
+    def _poll_signals(self) -> Tuple[bool, Optional[str]]:
+        """Poll the human-controlled inputs checked at the top of each iteration.
+
+        Each probe is a single syscall: a stat of stop.txt and, unless
+        stopping, one open of the pending feedback file.
+
+        Returns:
+            Tuple of (should stop, pending feedback content or None)
+        """
+        if self._check_stop_file():
+            return True, None
+        return False, self.feedback_manager.read_pending_feedback()
+
+    def _load_tasks(self) -> Optional[Tuple[int, int, int, str]]:
+        """Scan tasks.md, re-reading it only when it changes on disk.
+
+        Returns:
+            Tuple of (pending, in_progress, completed, current task description),
+            or None if there is no tasks.md
+
+        Raises:
+            OSError: If tasks.md exists but cannot be read
+        """
+        tasks_file = self.config.tasks_file
+        if not tasks_file:
+            return None
+
+        try:
+            st = os.stat(tasks_file)
+        except FileNotFoundError:
+            return None
+
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._tasks_key:
+            self._tasks_scan = self._scan_tasks(tasks_file.read_text())
+            self._tasks_key = key
+        return self._tasks_scan
+
+    @staticmethod
+    def _scan_tasks(content: str) -> Tuple[int, int, int, str]:
+        """Count task checkboxes and find the in-progress task in one regex scan.
+
+        Args:
+            content: Contents of tasks.md
+
+        Returns:
+            Tuple of (pending, in_progress, completed, current task description)
+        """
+        counts = {" ": 0, "-": 0, "x": 0}
+        current_desc: Optional[str] = None
+
+        for match in _TASK_RE.finditer(content):
+            indent, marker = match.group(1, 2)
+            # Counted checkboxes start a line (following a newline) without indentation
+            if not indent and match.start():
+                counts[marker] += 1
+
+            if current_desc is None and marker == "-":
+                # Extract task description
+                desc = match.group().replace("- [-]", "").strip()
+                current_desc = desc if desc else "In progress task (no description)"
+
+        pending, in_progress, completed = counts[" "], counts["-"], counts["x"]
+        return pending, in_progress, completed, current_desc or "Waiting for next task"
+
     def _get_task_counts(self) -> Tuple[int, int, int]:
         """Get task counts from tasks.md if available.
 
         Returns:
             Tuple of (pending, in_progress, completed) counts
         """
-        if self.config.is_steering_driven or not self.config.tasks_file:
-            return 0, 0, 0
-
-        if not self.config.tasks_file.exists():
+        if self.config.is_steering_driven:
             return 0, 0, 0
 
         try:
-            content = self.config.tasks_file.read_text()
-            pending = content.count("\n- [ ]")
-            in_progress = content.count("\n- [-]")
-            completed = content.count("\n- [x]")
-            return pending, in_progress, completed
+            tasks = self._load_tasks()
         except IOError:
             return 0, 0, 0
 
+        if tasks is None:
+            return 0, 0, 0
+        pending, in_progress, completed, _ = tasks
+        return pending, in_progress, completed
+
     def _get_current_task_description(self) -> str:
         """Get the current task description from tasks.md.
 
@@ -139,20 +404,15 @@ class AutonomousRunner:
         if self.config.is_steering_driven:
             return "Working from steering documents"
 
-        if not self.config.tasks_file or not self.config.tasks_file.exists():
-            return "No tasks.md found"
-
         try:
-            content = self.config.tasks_file.read_text()
-            for line in content.split("\n"):
-                if line.strip().startswith("- [-]"):
-                    # Extract task description
-                    desc = line.replace("- [-]", "").strip()
-                    return desc if desc else "In progress task (no description)"
-            return "Waiting for next task"
+            tasks = self._load_tasks()
         except IOError:
             return "Error reading tasks.md"
 
+        if tasks is None:
+            return "No tasks.md found"
+        return tasks[3]
+
     def _write_state(
         self,
         status: RunStatus,
@@ -160,6 +420,7 @@ class AutonomousRunner:
         current_task_desc: str,
         task_status: TaskStatus,
         last_output: str,
+        code_metrics: Optional[CodeMetrics] = None,
     ) -> None:
         """Write current state to state file.
 
@@ -169,22 +430,79 @@ class AutonomousRunner:
             current_task_desc: Description of current task
             task_status: Status of current task
             last_output: Recent output message
+            code_metrics: Metrics to report; collected afresh if None
         """
-        state = State(
-            status=status,
-            iteration=IterationState(
-                current=iteration,
-                specified=self.config.max_iterations,
-            ),
-            code_metrics=collect_code_metrics(self.config.project_root),
-            current_task=TaskInfo(
-                description=current_task_desc,
-                status=task_status,
-            ),
-            last_output=last_output,
-            timestamp=datetime.now(),
+        if code_metrics is None:
+            code_metrics = self._code_metrics = collect_code_metrics(self.config.project_root)
+
+        # Skip the write if nothing but the timestamp would change since the last one.
+        # Only the latest write counts: matching an older state would leave a
+        # newer one on disk.
+        digest = blake2b(
+            repr(
+                (
+                    status.value,
+                    iteration,
+                    code_metrics.total_lines,
+                    code_metrics.file_count,
+                    current_task_desc,
+                    task_status.value,
+                    last_output,
+                )
+            ).encode("utf-8"),
+            digest_size=8,
+        ).digest()
+        if digest == self._last_state_digest:
+            return
+
+        State.dump_fast(
+            self.config.state_file,
+            status,
+            iteration,
+            self.config.max_iterations,
+            code_metrics,
+            current_task_desc,
+            task_status,
+            last_output,
         )
-        state.save(self.config.state_file)
+        self._last_state_digest = digest
+
+    def _read_head_commit(self) -> Optional[str]:
+        """Resolve HEAD by reading the repository's .git directory directly.
+
+        Handles a detached HEAD, loose branch refs, and packed refs.
+
+        Returns:
+            Commit SHA, or None if HEAD can't be resolved this way
+            (e.g. worktrees, submodules, or project_root below the repo root)
+        """
+        git_dir = self._git_dir
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+
+        if not head.startswith("ref: "):
+            return head if _SHA_RE.fullmatch(head) else None
+
+        ref = head[len("ref: ") :]
+        try:
+            sha = (git_dir / ref).read_text().strip()
+            return sha if _SHA_RE.fullmatch(sha) else None
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return None
+
+        try:
+            with open(git_dir / "packed-refs") as f:
+                for line in f:
+                    sha, _, name = line.rstrip("\n").partition(" ")
+                    if name == ref and _SHA_RE.fullmatch(sha):
+                        return sha
+        except OSError:
+            pass
+        return None
 
     def _get_current_commit(self) -> Optional[str]:
         """Get current git commit SHA.
@@ -192,6 +510,11 @@ class AutonomousRunner:
         Returns:
             Commit SHA or None if not in git repo
         """
+        sha = self._read_head_commit()
+        if sha:
+            return sha
+
+        # Fall back to git itself for layouts _read_head_commit doesn't handle
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "HEAD"],
@@ -206,6 +529,102 @@ class AutonomousRunner:
             pass
         return None
 
+    def _close_git_batch(self) -> None:
+        """Shut down the long-lived `git cat-file --batch` process, if any."""
+        proc = self._git_batch
+        self._git_batch = None
+        if proc is None:
+            return
+        try:
+            if proc.stdin:
+                proc.stdin.close()
+            proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+
+    def _commit_parents(self, sha: str) -> Optional[list[str]]:
+        """Look up a commit's parents through a long-lived `git cat-file --batch`.
+
+        The process is started on first use and reused across iterations.
+
+        Args:
+            sha: Commit SHA
+
+        Returns:
+            Parent SHAs, or None if the commit can't be read
+        """
+        proc = self._git_batch
+        if proc is None or proc.poll() is not None:
+            try:
+                proc = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    cwd=self.config.project_root,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except FileNotFoundError:
+                return None
+            if self._git_batch is None:
+                atexit.register(self._close_git_batch)
+            self._git_batch = proc
+
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(sha.encode("ascii") + b"\n")
+            proc.stdin.flush()
+            # "<sha> <type> <size>" then the object, or "<sha> missing"
+            header = proc.stdout.readline().split()
+            if len(header) != 3:
+                return None
+            body = proc.stdout.read(int(header[2]) + 1)
+        except (OSError, ValueError):
+            self._close_git_batch()
+            return None
+
+        if header[1] != b"commit":
+            return None
+        parents = []
+        for line in body.split(b"\n"):
+            if not line:
+                break
+            if line.startswith(b"parent "):
+                parents.append(line[len(b"parent ") :].decode("ascii"))
+        return parents
+
+    def _walk_commits_between(self, commit1: str, commit2: str) -> Optional[int]:
+        """Count commits in commit1..commit2 by walking parents back from commit2.
+
+        Only succeeds when every path leads back to commit1, as it does for the
+        runner's own commits; anything else is left to `git rev-list`.
+
+        Args:
+            commit1: First commit SHA
+            commit2: Second commit SHA
+
+        Returns:
+            Number of commits, or None if the walk can't answer exactly
+        """
+        seen = {commit2}
+        stack = [commit2]
+        count = 0
+        while stack:
+            sha = stack.pop()
+            if sha == commit1:
+                continue
+            count += 1
+            if count > _MAX_COMMIT_WALK:
+                return None
+            parents = self._commit_parents(sha)
+            if not parents:
+                # Unreadable, or a root commit: the walk escaped past commit1
+                return None
+            for parent in parents:
+                if parent not in seen:
+                    seen.add(parent)
+                    stack.append(parent)
+        return count
+
     def _count_commits_between(self, commit1: str, commit2: str) -> int:
         """Count commits between two SHAs.
 
@@ -216,6 +635,10 @@ class AutonomousRunner:
         Returns:
             Number of commits
         """
+        count = self._walk_commits_between(commit1, commit2)
+        if count is not None:
+            return count
+
         try:
             result = subprocess.run(
                 ["git", "rev-list", f"{commit1}..{commit2}", "--count"],
@@ -246,6 +669,32 @@ class AutonomousRunner:
             return []
         return []
 
+    def _prompt_template(self, steering_driven: bool) -> str:
+        """Get the prompt template with the run's fixed values filled in.
+
+        Args:
+            steering_driven: Whether the runner is in steering-driven mode
+
+        Returns:
+            Template with {iteration}, {feedback_section} and {cleanup_section} slots
+        """
+        template = self._prompt_templates.get(steering_driven)
+        if template is None:
+            mode_status = (
+                "Steering-driven (working from product.md directly)"
+                if steering_driven
+                else f"Task-driven (spec: {self.config.spec_name})"
+            )
+            template = _PROMPT_TEMPLATE.format(
+                iteration="{iteration}",
+                max_iterations=self.config.max_iterations,
+                mode_status=mode_status.replace("{", "{{").replace("}", "}}"),
+                feedback_section="{feedback_section}",
+                cleanup_section="{cleanup_section}",
+            )
+            self._prompt_templates[steering_driven] = template
+        return template
+
     def _build_prompt(self, iteration: int, feedback_content: Optional[str], git_status: list[str]) -> str:
         """Build the prompt for Codex.
 
@@ -259,100 +708,121 @@ class AutonomousRunner:
         """
         # This would load the full prompt template
         # For now, returning a simplified version
-        mode_status = (
-            "Steering-driven (working from product.md directly)"
-            if self.config.is_steering_driven
-            else f"Task-driven (spec: {self.config.spec_name})"
-        )
-
         feedback_section = ""
         if feedback_content:
-            feedback_section = f"""
-### ⚠️ IMPORTANT: Human Feedback Available
-
-The human has posted async feedback for you to consider:
-
-```
-{feedback_content}
-```
-
-**Instructions:**
-- CONSIDER this feedback when deciding what to implement
-- If you address the feedback, mention it in your commit message
-- After processing, this feedback will be archived
-- Feedback is advisory - you can continue with planned work if more urgent
-"""
+            # Feedback usually stays pending across several iterations
+            cached_content, cached_section = self._feedback_section
+            if feedback_content == cached_content:
+                feedback_section = cached_section
+            else:
+                feedback_section = _FEEDBACK_TEMPLATE.format(feedback_content=feedback_content)
+                self._feedback_section = (feedback_content, feedback_section)
 
         cleanup_section = ""
         if git_status:
             dirty_preview = "\n".join(git_status[:10])
             more = "\n…" if len(git_status) > 10 else ""
-            cleanup_section = f"""
-## 🧹 Cleanup Before New Work
-The working tree is dirty. Review and commit before starting a new task.
-
-Dirty files (git status --short):
-```
-{dirty_preview}{more}
-```
-
-**Cleanup plan:**
-- Group related changes into semantic commits (e.g., api/web/tests).
-- Run relevant tests for each commit before pushing.
-- Only start new tasks once the workspace is clean or explain why cleanup was skipped.
-"""
-
-        prompt = f"""# Autonomous Development Task - Iteration {iteration}
-
-## Current Status
-- **Iteration**: {iteration} of {self.config.max_iterations}
-- **Mode**: {mode_status}
+            cleanup_section = _CLEANUP_TEMPLATE.format(dirty_preview=dirty_preview, more=more)
 
-{feedback_section}
-{cleanup_section}
-
-## Instructions
-Read steering documents → Find next task → Implement → Test → Commit → Exit
-
-**BEGIN IMPLEMENTATION NOW**
-"""
-        return prompt
+        return self._prompt_template(self.config.is_steering_driven).format(
+            iteration=iteration,
+            feedback_section=feedback_section,
+            cleanup_section=cleanup_section,
+        )
 
-    def _run_codex(self, prompt: str) -> int:
+    def _run_codex(self, prompt: str, iteration: int, current_task_desc: str) -> int:
         """Run Codex with the given prompt.
 
+        Codex output is streamed through to the console as it arrives. Every
+        heartbeat the stop file is checked and the state file refreshed with
+        the latest output, so the monitor stays live during long runs.
+
         Args:
             prompt: Prompt to send to Codex
+            iteration: Current iteration number
+            current_task_desc: Description of current task
 
         Returns:
             Exit code from Codex
         """
-        cmd = [
-            self.config.codex_cmd,
-            "e",
-            *self.config.codex_flags.split(),
-            "--model",
-            self.config.codex_model,
-            "-c",
-            f"max_tokens={self.config.max_tokens}",
-            "-c",
-            f"temperature={self.config.temperature}",
-            prompt,
-        ]
+        cmd = [*self._codex_argv_prefix, prompt]
 
         self.logger.info(f"🤖 Invoking Codex (model: {self.config.codex_model})...")
 
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
                 cwd=self.config.project_root,
-                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
             )
-            return result.returncode
         except FileNotFoundError:
             self.logger.error(f"❌ Codex command not found: {self.config.codex_cmd}")
             return 1
 
+        assert proc.stdout is not None
+        chunks: queue.SimpleQueue[Optional[bytes]] = queue.SimpleQueue()
+        threading.Thread(
+            target=_drain_pipe, args=(proc.stdout, chunks), name="steer-codex-output", daemon=True
+        ).start()
+        threading.Thread(
+            target=_wake_on_exit, args=(proc, chunks), name="steer-codex-wait", daemon=True
+        ).start()
+
+        out = self.console.file
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        tail: deque[str] = deque([""], maxlen=_OUTPUT_TAIL_LINES + 1)
+        stop_noted = False
+        deadline = time.monotonic() + _CODEX_HEARTBEAT
+        exit_deadline: Optional[float] = None
+
+        try:
+            while True:
+                wait_until = deadline if exit_deadline is None else exit_deadline
+                try:
+                    chunk = chunks.get(timeout=max(0.0, wait_until - time.monotonic()))
+                except queue.Empty:
+                    chunk = b""
+
+                # Stop at EOF (None) or once the grace period after exit runs out
+                now = time.monotonic()
+                done = chunk is None or (exit_deadline is not None and now >= exit_deadline)
+
+                # Flush any truncated UTF-8 sequence as U+FFFD when done
+                text = decoder.decode(chunk or b"", final=done)
+                if text:
+                    out.write(text)
+                    out.flush()
+                    lines = _LINE_BREAK_RE.split(text)
+                    tail[-1] = (tail[-1] + lines[0])[-_OUTPUT_LINE_CHARS:]
+                    tail.extend(line[-_OUTPUT_LINE_CHARS:] for line in lines[1:])
+                if done:
+                    break
+
+                if exit_deadline is None and proc.poll() is not None:
+                    exit_deadline = now + _EXIT_GRACE
+                if exit_deadline is not None or now < deadline:
+                    continue
+                deadline = now + _CODEX_HEARTBEAT
+
+                # Heartbeat: leave stop.txt for the next iteration boundary to act on
+                if not stop_noted and os.path.exists(self._stop_file):
+                    self.logger.info("🛑 Stop requested - exiting after Codex finishes...")
+                    stop_noted = True
+                self._write_state(
+                    RunStatus.RUNNING,
+                    iteration,
+                    current_task_desc,
+                    TaskStatus.IN_PROGRESS,
+                    "\n".join(tail).rstrip("\n") or f"Iteration {iteration} running...",
+                    code_metrics=self._code_metrics,
+                )
+            return proc.wait()
+        finally:
+            if proc.poll() is None:
+                proc.terminate()
+                proc.wait()
+
     def _handle_exit_code(
         self, exit_code: int, iteration: int, commit_before: Optional[str], commit_after: Optional[str]
     ) -> bool:
@@ -372,7 +842,7 @@ Read steering documents → Find next task → Implement → Test → Commit →
             self.consecutive_failures = 0
 
             # Archive feedback if it was processed and commits were made
-            if commit_before != commit_after and self.feedback_manager.has_pending_feedback():
+            if commit_before != commit_after:
                 archived = self.feedback_manager.archive_feedback()
                 if archived:
                     self.logger.info(f"📦 Feedback archived to: {archived.name}")
@@ -380,11 +850,7 @@ Read steering documents → Find next task → Implement → Test → Commit →
             return True
 
         elif exit_code == 99:
-            self.console.print()
-            self.console.print("╔════════════════════════════════════════════════════════╗", style="green")
-            self.console.print("║  🎉 PROJECT COMPLETE!                                 ║", style="green")
-            self.console.print("║  All tasks done. Ready for review.                    ║", style="green")
-            self.console.print("╚════════════════════════════════════════════════════════╝", style="green")
+            self.console.print(_COMPLETE_BANNER)
             return False
 
         elif exit_code == 1:
@@ -392,11 +858,15 @@ Read steering documents → Find next task → Implement → Test → Commit →
             self.logger.error(f"❌ Error encountered (failure {self.consecutive_failures} of {self.config.max_consecutive_failures})")
 
             if self.consecutive_failures >= self.config.max_consecutive_failures:
-                self.console.print()
-                self.console.print("╔════════════════════════════════════════════════════════╗", style="red")
-                self.console.print("║  ⚠️  ESCALATION REQUIRED                              ║", style="red")
-                self.console.print(f"║  {self.config.max_consecutive_failures} consecutive failures. Human intervention needed.   ║", style="red")
-                self.console.print("╚════════════════════════════════════════════════════════╝", style="red")
+                self.console.print(
+                    _banner(
+                        "⚠️  ESCALATION REQUIRED",
+                        f"{self.config.max_consecutive_failures} consecutive failures. "
+                        "Human intervention needed.",
+                        style="red",
+                        trailing_blank=False,
+                    )
+                )
                 return False
 
             self.logger.warning("Retrying with next iteration...")
@@ -426,11 +896,20 @@ Read steering documents → Find next task → Implement → Test → Commit →
             iteration += 1
             next_checkpoint = ((iteration // self.config.checkpoint_interval) + 1) * self.config.checkpoint_interval
 
-            self.console.print()
-            self.console.print("═══════════════════════════════════════════════════════════", style="blue")
-            self.console.print(f"  Iteration {iteration} of {self.config.max_iterations}", style="blue")
-            self.console.print("═══════════════════════════════════════════════════════════", style="blue")
-            self.console.print()
+            self.console.print(
+                Padding(
+                    Text(
+                        f"{_RULE}\n  Iteration {iteration} of {self.config.max_iterations}"
+                        f"\n{_RULE}",
+                        style="blue",
+                    ),
+                    (1, 0),
+                )
+            )
+
+            # Start the git queries now so they overlap with the task, state and feedback I/O
+            commit_future = self._io_pool.submit(self._get_current_commit)
+            git_status_future = self._io_pool.submit(self._get_git_status)
 
             # Get task counts
             pending, in_progress, completed = self._get_task_counts()
@@ -454,23 +933,22 @@ Read steering documents → Find next task → Implement → Test → Commit →
                 f"Iteration {iteration} starting...",
             )
 
-            # Check for stop file
-            if self._check_stop_file():
+            # Check for stop file and feedback
+            stop, feedback_content = self._poll_signals()
+            if stop:
                 self.logger.info("Exiting gracefully...")
                 return 0
 
-            # Check for feedback
-            feedback_content = self.feedback_manager.read_pending_feedback()
             if feedback_content:
                 self.logger.info("📬 Human feedback detected!")
 
             # Get commit before
-            commit_before = self._get_current_commit()
+            commit_before = commit_future.result()
             if commit_before:
                 self.logger.info(f"📍 Current commit: {commit_before[:7]}")
 
             # Check git status for cleanup hints
-            git_status = self._get_git_status()
+            git_status = git_status_future.result()
             if git_status:
                 self.logger.warning("🧹 Uncommitted changes detected; prompting for cleanup commits before new work.")
 
@@ -478,7 +956,7 @@ Read steering documents → Find next task → Implement → Test → Commit →
             prompt = self._build_prompt(iteration, feedback_content, git_status)
 
             # Run Codex
-            exit_code = self._run_codex(prompt)
+            exit_code = self._run_codex(prompt, iteration, current_task_desc)
             self.logger.info(f"Codex exited with code: {exit_code}")
 
             # Get commit after
@@ -492,12 +970,15 @@ Read steering documents → Find next task → Implement → Test → Commit →
                 )
 
                 if self.no_progress_count >= self.config.max_no_progress:
-                    self.console.print()
-                    self.console.print("╔════════════════════════════════════════════════════════╗", style="red")
-                    self.console.print("║  🛑 CIRCUIT BREAKER TRIGGERED                         ║", style="red")
-                    self.console.print(f"║  No commits for {self.config.max_no_progress} iterations.                     ║", style="red")
-                    self.console.print("║  AI is not making progress. Human intervention needed.║", style="red")
-                    self.console.print("╚════════════════════════════════════════════════════════╝", style="red")
+                    self.console.print(
+                        _banner(
+                            "🛑 CIRCUIT BREAKER TRIGGERED",
+                            f"No commits for {self.config.max_no_progress} iterations.",
+                            "AI is not making progress. Human intervention needed.",
+                            style="red",
+                            trailing_blank=False,
+                        )
+                    )
                     return 1
             else:
                 # Progress made - reset counter
@@ -519,11 +1000,12 @@ Read steering documents → Find next task → Implement → Test → Commit →
 
             # Checkpoint check
             if iteration % self.config.checkpoint_interval == 0:
-                self.console.print()
-                self.console.print("╔════════════════════════════════════════════════════════╗", style="yellow")
-                self.console.print(f"║  📊 CHECKPOINT {iteration // self.config.checkpoint_interval} REACHED                               ║", style="yellow")
-                self.console.print("╚════════════════════════════════════════════════════════╝", style="yellow")
-                self.console.print()
+                self.console.print(
+                    _banner(
+                        f"📊 CHECKPOINT {iteration // self.config.checkpoint_interval} REACHED",
+                        style="yellow",
+                    )
+                )
                 self.logger.info("Progress Summary:")
                 self.logger.info(f"  Iterations completed: {iteration}")
                 self.logger.info(f"  Tasks completed: {completed}")
@@ -541,18 +1023,18 @@ Read steering documents → Find next task → Implement → Test → Commit →
                 )
                 return 2
 
-            # Brief pause between iterations
-            time.sleep(2)
+            # Back off before retrying after a failure; otherwise pause only if configured
+            if exit_code == 1:
+                time.sleep(_FAILURE_BACKOFF * 2 ** (self.consecutive_failures - 1))
+            elif self.config.inter_iteration_sleep:
+                time.sleep(self.config.inter_iteration_sleep)
 
         # Max iterations reached
-        self.console.print()
-        self.console.print("╔════════════════════════════════════════════════════════╗", style="yellow")
-        self.console.print("║  ⚠️  MAX ITERATIONS REACHED                           ║", style="yellow")
-        self.console.print("║  Human review required before continuing.             ║", style="yellow")
-        self.console.print("╚════════════════════════════════════════════════════════╝", style="yellow")
-        self.console.print()
+        self.console.print(_MAX_ITERATIONS_BANNER)
         self.logger.info("📊 Statistics:")
         self.logger.info(f"  Iterations completed: {self.config.max_iterations}")
+        # Rescan so the summary includes the final iteration's work; this is a
+        # single stat when tasks.md hasn't changed
         pending, _, completed = self._get_task_counts()
         self.logger.info(f"  Tasks completed: {completed}")
         self.logger.info(f"  Tasks pending: {pending}")
@@ -1,10 +1,12 @@
 """State management for monitoring and persistence."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -56,17 +58,62 @@ class State(BaseModel):
     code_metrics: CodeMetrics = Field(default_factory=CodeMetrics, description="Code metrics")
     current_task: TaskInfo = Field(description="Current task information")
     last_output: str = Field(default="", description="Recent output from the runner")
-    timestamp: datetime = Field(default_factory=datetime.now, description="State timestamp")
+    timestamp: Optional[datetime] = Field(
+        default=None, description="State timestamp (set when the state is saved)"
+    )
 
     def save(self, path: Path) -> None:
         """Save state to JSON file.
 
+        The file is replaced atomically so readers never see a partial write.
+        A state without a timestamp is stamped with the current time.
+
         Args:
             path: Path to save the state file
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.model_dump(mode="json"), f, indent=2, default=str)
+        if self.timestamp is None:
+            self.timestamp = datetime.now()
+        _replace_file(path, self.model_dump_json(indent=2).encode("utf-8"))
+
+    @staticmethod
+    def dump_fast(
+        path: Path,
+        status: RunStatus,
+        iteration: int,
+        max_iterations: int,
+        code_metrics: CodeMetrics,
+        task_description: str,
+        task_status: TaskStatus,
+        last_output: str,
+    ) -> None:
+        """Save a state built from trusted values without model validation.
+
+        Writes the same JSON as save() for the equivalent State, stamped with
+        the current time. Meant for the runner's own frequent writes; anything
+        read back goes through load() and is validated there.
+
+        Args:
+            path: Path to save the state file
+            status: Overall runner status
+            iteration: Current iteration number
+            max_iterations: Specified maximum iterations
+            code_metrics: Code metrics
+            task_description: Description of the current task
+            task_status: Status of the current task
+            last_output: Recent output from the runner
+        """
+        data = {
+            "status": status.value,
+            "iteration": {"current": iteration, "specified": max_iterations},
+            "code_metrics": {
+                "total_lines": code_metrics.total_lines,
+                "file_count": code_metrics.file_count,
+            },
+            "current_task": {"description": task_description, "status": task_status.value},
+            "last_output": last_output,
+            "timestamp": datetime.now().isoformat(),
+        }
+        _replace_file(path, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
 
     @classmethod
     def load(cls, path: Path) -> Optional["State"]:
@@ -78,14 +125,25 @@ class State(BaseModel):
         Returns:
             State object or None if file doesn't exist or is invalid
         """
-        if not path.exists():
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
             return None
+        return cls.loads(data)
+
+    @classmethod
+    def loads(cls, data: bytes) -> Optional["State"]:
+        """Parse state from serialized JSON.
 
+        Args:
+            data: Raw contents of a state file
+
+        Returns:
+            State object or None if the data is invalid
+        """
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
-            return cls(**data)
-        except (json.JSONDecodeError, ValueError):
+            return cls.model_validate_json(data)
+        except ValueError:
             return None
 
     @classmethod
@@ -109,6 +167,89 @@ class State(BaseModel):
         )
 
 
+def _replace_file(path: Path, data: bytes) -> None:
+    """Write data to path atomically via a temporary file and os.replace.
+
+    Callers serialize the whole file up front so it goes out in a single
+    binary write.
+
+    Args:
+        path: Destination file
+        data: Complete file contents
+    """
+    if not path.parent.is_dir():
+        path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+# Source file extensions counted by collect_code_metrics
+_SOURCE_SUFFIXES = (".ts", ".tsx", ".js", ".py")
+
+_READ_CHUNK_SIZE = 1 << 20
+
+# Below this many files, counting lines on worker threads costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+# Last metrics per src directory, keyed by a (file count, total mtime_ns, total size)
+# fingerprint of its source files
+_METRICS_CACHE: Dict[str, Tuple[Tuple[int, int, int], CodeMetrics]] = {}
+
+
+def _iter_source_files(directory: str) -> Iterator[os.DirEntry]:
+    """Yield source files under a directory in a single walk.
+
+    Symlinked directories are not followed.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        Directory entry of each file with a source extension
+    """
+    pending = [directory]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(_SOURCE_SUFFIXES):
+                    yield entry
+
+
+def _count_lines(path: str) -> int:
+    """Count lines in a file by counting newline bytes.
+
+    A final line without a trailing newline is counted too.
+
+    Args:
+        path: File to count
+
+    Returns:
+        Number of lines
+    """
+    lines = 0
+    last_byte = b"\n"
+    with open(path, "rb", buffering=0) as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            lines += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    return lines + (last_byte != b"\n")
+
+
+def _count_lines_or_zero(path: str) -> int:
+    """Count lines in a file, treating an unreadable file as empty."""
+    try:
+        return _count_lines(path)
+    except OSError:
+        return 0
+
+
 def collect_code_metrics(project_root: Path) -> CodeMetrics:
     """Collect code metrics from the project.
 
@@ -122,18 +263,33 @@ def collect_code_metrics(project_root: Path) -> CodeMetrics:
     if not src_dir.exists():
         return CodeMetrics(total_lines=0, file_count=0)
 
-    total_lines = 0
-    file_count = 0
-
-    for ext in ["*.ts", "*.tsx", "*.js", "*.py"]:
-        files = list(src_dir.rglob(ext))
-        file_count += len(files)
-
-        for file in files:
-            try:
-                with open(file, "r") as f:
-                    total_lines += sum(1 for _ in f)
-            except (IOError, UnicodeDecodeError):
-                continue
-
-    return CodeMetrics(total_lines=total_lines, file_count=file_count)
+    # Stat every source file (cheap) and only read them if anything changed
+    src_key = str(src_dir)
+    paths = []
+    mtime_total = 0
+    size_total = 0
+    for entry in _iter_source_files(src_key):
+        paths.append(entry.path)
+        try:
+            st = entry.stat()
+        except OSError:
+            continue
+        mtime_total += st.st_mtime_ns
+        size_total += st.st_size
+
+    fingerprint = (len(paths), mtime_total, size_total)
+    cached = _METRICS_CACHE.get(src_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    # Reads release the GIL, so a cold tree is counted in parallel
+    if len(paths) < _PARALLEL_MIN_FILES:
+        total_lines = sum(map(_count_lines_or_zero, paths))
+    else:
+        max_workers = min(32, len(paths) // 8, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            total_lines = sum(pool.map(_count_lines_or_zero, paths))
+
+    metrics = CodeMetrics(total_lines=total_lines, file_count=len(paths))
+    _METRICS_CACHE[src_key] = (fingerprint, metrics)
+    return metrics
@@ -0,0 +1,106 @@
+"""Tests for the command-line argument parser."""
+
+from pathlib import Path
+
+import pytest
+
+from steer_driven_runner.cli import (
+    _FEEDBACK_OPTIONS,
+    _RUN_OPTIONS,
+    FEEDBACK_USAGE,
+    RUN_USAGE,
+    _parse_args,
+)
+
+
+def parse_run(argv):
+    return _parse_args(argv, _RUN_OPTIONS, RUN_USAGE)
+
+
+class TestParseArgs:
+    """Flag forms accepted by _parse_args."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["-i50"], ["-i", "50"], ["--iterations=50"], ["--iterations", "50"]],
+    )
+    def test_value_forms(self, argv):
+        assert parse_run(argv) == ({"max_iterations": 50}, [])
+
+    def test_multiple_flags(self, tmp_path):
+        values, _ = parse_run(["-c", "5", "--spec=auth", "-mgpt-5-codex", "-p", str(tmp_path)])
+        assert values == {
+            "checkpoint_interval": 5,
+            "spec_name": "auth",
+            "codex_model": "gpt-5-codex",
+            "project_root": Path(tmp_path),
+        }
+
+    def test_value_may_contain_equals(self):
+        values, _ = parse_run(["--spec=a=b"])
+        assert values == {"spec_name": "a=b"}
+
+    def test_later_flag_wins(self):
+        values, _ = parse_run(["-i", "1", "--iterations", "2"])
+        assert values == {"max_iterations": 2}
+
+    def test_double_dash_ends_options(self):
+        values, positional = _parse_args(
+            ["-p", "high", "--", "--type is not a flag here"],
+            _FEEDBACK_OPTIONS,
+            FEEDBACK_USAGE,
+            nargs=1,
+        )
+        assert values == {"priority": "HIGH"}
+        assert positional == ["--type is not a flag here"]
+
+    def test_positional_before_flags(self):
+        values, positional = _parse_args(
+            ["Fix the login page", "-t", "bug"], _FEEDBACK_OPTIONS, FEEDBACK_USAGE, nargs=1
+        )
+        assert values == {"feedback_type": "BUG"}
+        assert positional == ["Fix the login page"]
+
+
+class TestParseArgsErrors:
+    """Usage errors exit with status 2 and a message on stderr."""
+
+    def assert_usage_error(self, capsys, argv, message, options=_RUN_OPTIONS, nargs=0):
+        with pytest.raises(SystemExit) as exc_info:
+            _parse_args(argv, options, RUN_USAGE, nargs=nargs)
+        assert exc_info.value.code == 2
+        err = capsys.readouterr().err
+        assert err.startswith("Usage: steer-run [OPTIONS]\n")
+        assert f"Error: {message}" in err
+
+    @pytest.mark.parametrize("argv", [["-i"], ["--iterations"], ["-c", "5", "-i"]])
+    def test_missing_value(self, capsys, argv):
+        self.assert_usage_error(capsys, argv, f"Option '{argv[-1]}' requires an argument.")
+
+    def test_invalid_integer(self, capsys):
+        self.assert_usage_error(
+            capsys, ["-i", "many"], "Invalid value for '-i': 'many' is not a valid integer."
+        )
+
+    def test_unknown_option(self, capsys):
+        self.assert_usage_error(capsys, ["--iteration=5"], "No such option: --iteration")
+
+    def test_missing_project_root(self, capsys, tmp_path):
+        missing = tmp_path / "missing"
+        self.assert_usage_error(
+            capsys, ["-p", str(missing)], f"Invalid value for '-p': Directory {str(missing)!r}"
+        )
+
+    def test_missing_positional(self, capsys):
+        self.assert_usage_error(
+            capsys, ["-p", "low"], "Missing argument 'MESSAGE'.", _FEEDBACK_OPTIONS, nargs=1
+        )
+
+    def test_extra_positional(self, capsys):
+        self.assert_usage_error(capsys, ["stray"], "Got unexpected extra argument (stray)")
+
+    def test_help_exits_zero(self, capsys):
+        with pytest.raises(SystemExit) as exc_info:
+            parse_run(["-i", "5", "--help"])
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out == RUN_USAGE + "\n"
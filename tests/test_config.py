@@ -0,0 +1,100 @@
+"""Tests for environment and .env configuration loading."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from steer_driven_runner.config import Config, _read_env_file
+
+
+@pytest.fixture
+def clean_env(monkeypatch, tmp_path):
+    """Run from an empty directory with no STEER_* variables set."""
+    for key in list(os.environ):
+        if key.upper().startswith("STEER_"):
+            monkeypatch.delenv(key)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def write_env(directory: Path, text: str) -> str:
+    path = directory / ".env"
+    path.write_text(text)
+    return str(path)
+
+
+class TestReadEnvFile:
+    """Dotenv syntax accepted by _read_env_file."""
+
+    def test_export_quotes_and_comments(self, tmp_path):
+        path = write_env(
+            tmp_path,
+            "# Runner settings\n"
+            "\n"
+            "export STEER_MAX_ITERATIONS=25\n"
+            "STEER_CODEX_MODEL = 'gpt-5-codex'\n"
+            'STEER_CODEX_FLAGS="--full-auto --search"\n'
+            "STEER_SPEC_NAME=auth # inline comment\n"
+            'STEER_CODEX_CMD="codex # not a comment" # but this is\n'
+            "   # indented comment\n"
+            "NOT_A_SETTING\n",
+        )
+        assert _read_env_file(path) == {
+            "STEER_MAX_ITERATIONS": "25",
+            "STEER_CODEX_MODEL": "gpt-5-codex",
+            "STEER_CODEX_FLAGS": "--full-auto --search",
+            "STEER_SPEC_NAME": "auth",
+            "STEER_CODEX_CMD": "codex # not a comment",
+        }
+
+    def test_hash_without_whitespace_is_kept(self, tmp_path):
+        path = write_env(tmp_path, "STEER_SPEC_NAME=issue#42\n")
+        assert _read_env_file(path) == {"STEER_SPEC_NAME": "issue#42"}
+
+    @pytest.mark.parametrize(
+        "text", ["STEER_SPEC_NAME=\n", "STEER_SPEC_NAME= # unset\n", 'STEER_SPEC_NAME=""\n']
+    )
+    def test_empty_values(self, tmp_path, text):
+        assert _read_env_file(write_env(tmp_path, text)) == {"STEER_SPEC_NAME": ""}
+
+    def test_unterminated_quote_is_literal(self, tmp_path):
+        path = write_env(tmp_path, "STEER_CODEX_MODEL='gpt-5-codex\n")
+        assert _read_env_file(path) == {"STEER_CODEX_MODEL": "'gpt-5-codex"}
+
+    def test_missing_file(self, tmp_path):
+        assert _read_env_file(str(tmp_path / ".env")) == {}
+
+
+class TestConfigFromCli:
+    """Precedence and coercion in Config.from_cli."""
+
+    def test_defaults(self, clean_env):
+        config = Config.from_cli()
+        assert config.max_iterations == 50
+        assert config.spec_name is None
+        assert config.project_root == clean_env
+
+    def test_env_file_values_are_coerced(self, clean_env):
+        write_env(
+            clean_env,
+            "STEER_MAX_ITERATIONS=7\nsteer_temperature=0.5\nSTEER_SPEC_NAME=\nSTEER_UNKNOWN=1\n",
+        )
+        config = Config.from_cli()
+        assert config.max_iterations == 7
+        assert config.temperature == 0.5
+        assert config.spec_name is None
+
+    def test_environment_overrides_env_file(self, clean_env, monkeypatch):
+        write_env(clean_env, "STEER_MAX_ITERATIONS=7\n")
+        monkeypatch.setenv("STEER_MAX_ITERATIONS", "9")
+        assert Config.from_cli().max_iterations == 9
+
+    def test_cli_overrides_environment(self, clean_env, monkeypatch):
+        monkeypatch.setenv("STEER_MAX_ITERATIONS", "9")
+        assert Config.from_cli(max_iterations=3).max_iterations == 3
+
+    def test_invalid_value(self, clean_env, monkeypatch):
+        monkeypatch.setenv("STEER_MAX_ITERATIONS", "lots")
+        with pytest.raises(ValueError, match="Invalid value for STEER_MAX_ITERATIONS: 'lots'"):
+            Config.from_cli()
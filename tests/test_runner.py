@@ -0,0 +1,263 @@
+"""Tests for the autonomous runner."""
+
+import logging
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+
+from steer_driven_runner import runner as runner_module
+from steer_driven_runner.config import Config
+from steer_driven_runner.runner import AutonomousRunner
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def commit(repo: Path, message: str) -> str:
+    git(repo, "commit", "--allow-empty", "-q", "-m", message)
+    return git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    """An empty git repository on branch main."""
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "test@example.com")
+    git(tmp_path, "init", "-q", "-b", "main")
+    return tmp_path
+
+
+@pytest.fixture
+def runner(repo):
+    runner = AutonomousRunner(Config(project_root=repo))
+    yield runner
+    runner._close_git_batch()
+
+
+@requires_git
+class TestReadHeadCommit:
+    """_read_head_commit agrees with `git rev-parse HEAD`."""
+
+    def test_loose_ref(self, repo, runner):
+        sha = commit(repo, "first")
+        assert (repo / ".git" / "refs" / "heads" / "main").is_file()
+        assert runner._read_head_commit() == sha
+
+    def test_packed_ref(self, repo, runner):
+        sha = commit(repo, "first")
+        git(repo, "pack-refs", "--all")
+        assert not (repo / ".git" / "refs" / "heads" / "main").exists()
+        assert runner._read_head_commit() == sha
+
+    def test_packed_ref_shadowed_by_loose_ref(self, repo, runner):
+        commit(repo, "first")
+        git(repo, "pack-refs", "--all")
+        sha = commit(repo, "second")
+        assert runner._read_head_commit() == sha
+
+    def test_detached_head(self, repo, runner):
+        first = commit(repo, "first")
+        commit(repo, "second")
+        git(repo, "checkout", "-q", "--detach", first)
+        assert runner._read_head_commit() == first
+        assert runner._get_current_commit() == first
+
+    def test_unborn_branch(self, runner):
+        assert runner._read_head_commit() is None
+        assert runner._get_current_commit() is None
+
+    def test_not_a_repository(self, tmp_path):
+        runner = AutonomousRunner(Config(project_root=tmp_path / "missing"))
+        assert runner._read_head_commit() is None
+
+    def test_subdirectory_falls_back_to_git(self, repo):
+        sha = commit(repo, "first")
+        (repo / "app").mkdir()
+        runner = AutonomousRunner(Config(project_root=repo / "app"))
+        assert runner._read_head_commit() is None
+        assert runner._get_current_commit() == sha
+
+
+def rev_list_count(repo: Path, commit1: str, commit2: str) -> int:
+    return int(git(repo, "rev-list", "--count", f"{commit1}..{commit2}"))
+
+
+@requires_git
+class TestCountCommitsBetween:
+    """The cat-file parent walk agrees with `git rev-list --count`."""
+
+    def test_linear_history(self, repo, runner):
+        base = commit(repo, "base")
+        for n in range(3):
+            head = commit(repo, f"change {n}")
+        assert runner._walk_commits_between(base, head) == 3
+        assert runner._count_commits_between(base, head) == rev_list_count(repo, base, head)
+
+    def test_no_new_commits(self, repo, runner):
+        base = commit(repo, "base")
+        assert runner._walk_commits_between(base, base) == 0
+
+    def test_merge_of_branch_started_after_base(self, repo, runner):
+        base = commit(repo, "base")
+        git(repo, "checkout", "-q", "-b", "feature")
+        commit(repo, "feature 1")
+        commit(repo, "feature 2")
+        git(repo, "checkout", "-q", "main")
+        commit(repo, "main 1")
+        git(repo, "merge", "-q", "--no-ff", "--no-edit", "feature")
+        head = git(repo, "rev-parse", "HEAD")
+
+        # Both sides of the merge lead back to base, so the walk answers exactly
+        assert runner._walk_commits_between(base, head) == rev_list_count(repo, base, head) == 4
+
+    def test_merge_of_branch_started_before_base(self, repo, runner):
+        commit(repo, "root")
+        git(repo, "checkout", "-q", "-b", "feature")
+        commit(repo, "feature 1")
+        git(repo, "checkout", "-q", "main")
+        base = commit(repo, "base")
+        git(repo, "merge", "-q", "--no-ff", "--no-edit", "feature")
+        head = git(repo, "rev-parse", "HEAD")
+
+        # The feature side escapes past base, so counting defers to rev-list
+        assert runner._walk_commits_between(base, head) is None
+        assert runner._count_commits_between(base, head) == rev_list_count(repo, base, head) == 2
+
+    def test_long_history_defers_to_rev_list(self, repo, runner, monkeypatch):
+        monkeypatch.setattr("steer_driven_runner.runner._MAX_COMMIT_WALK", 2)
+        base = commit(repo, "base")
+        for n in range(3):
+            head = commit(repo, f"change {n}")
+        assert runner._walk_commits_between(base, head) is None
+        assert runner._count_commits_between(base, head) == 3
+
+    def test_unknown_commit(self, repo, runner):
+        head = commit(repo, "base")
+        assert runner._walk_commits_between("0" * 40, head) is None
+        assert runner._commit_parents("0" * 40) is None
+
+
+def render(console: Console, renderable) -> list[str]:
+    with console.capture() as capture:
+        console.print(renderable)
+    return [line.rstrip() for line in capture.get().split("\n")]
+
+
+@pytest.fixture
+def console():
+    return Console(width=80, color_system=None, force_terminal=False)
+
+
+@pytest.fixture
+def quiet_runner(tmp_path, console):
+    """A runner printing to the capture console, with logging kept out of the output."""
+    runner = AutonomousRunner(Config(project_root=tmp_path))
+    runner.__dict__["console"] = console
+    runner.__dict__["logger"] = logging.getLogger("steer_driven_runner.tests")
+    return runner
+
+
+class TestBanners:
+    """Milestone banners rendered as Rich panels.
+
+    Compared with the hand-drawn boxes they replaced, the border is now sized
+    to the text (the old fixed-width borders didn't line up with emoji), and
+    the text sits one space in from the border. Blank lines around each banner
+    are unchanged: one before, and one after except for the project complete,
+    escalation and circuit breaker banners, which end a run.
+    """
+
+    def test_start_banner(self, console):
+        assert render(console, runner_module._START_BANNER) == [
+            "",
+            "╔═══════════════════════════════════╗",
+            "║ 🤖 Steer-Driven Autonomous Runner ║",
+            "║ AI-Driven Development             ║",
+            "╚═══════════════════════════════════╝",
+            "",
+            "",
+        ]
+
+    def test_stop_banner(self, console):
+        assert render(console, runner_module._STOP_BANNER) == [
+            "",
+            "╔═══════════════════════════════════════════╗",
+            "║ 🛑 STOP FILE DETECTED                     ║",
+            "║ Graceful shutdown after current iteration ║",
+            "╚═══════════════════════════════════════════╝",
+            "",
+            "",
+        ]
+
+    def test_max_iterations_banner(self, console):
+        lines = render(console, runner_module._MAX_ITERATIONS_BANNER)
+        assert lines[0] == ""
+        assert lines[2].startswith("║ ⚠️  MAX ITERATIONS REACHED")
+        assert lines[3] == "║ Human review required before continuing. ║"
+        assert lines[-2:] == ["", ""]
+
+    def test_checkpoint_banner(self, console):
+        assert render(
+            console, runner_module._banner("📊 CHECKPOINT 2 REACHED", style="yellow")
+        ) == [
+            "",
+            "╔═════════════════════════╗",
+            "║ 📊 CHECKPOINT 2 REACHED ║",
+            "╚═════════════════════════╝",
+            "",
+            "",
+        ]
+
+    def test_without_trailing_blank(self, console):
+        banner = runner_module._banner(
+            "🛑 CIRCUIT BREAKER TRIGGERED", style="red", trailing_blank=False
+        )
+        assert render(console, banner) == [
+            "",
+            "╔══════════════════════════════╗",
+            "║ 🛑 CIRCUIT BREAKER TRIGGERED ║",
+            "╚══════════════════════════════╝",
+            "",
+        ]
+
+    def test_project_complete(self, quiet_runner, console):
+        with console.capture() as capture:
+            assert quiet_runner._handle_exit_code(99, 1, None, None) is False
+        assert [line.rstrip() for line in capture.get().split("\n")] == [
+            "",
+            "╔═══════════════════════════════════╗",
+            "║ 🎉 PROJECT COMPLETE!              ║",
+            "║ All tasks done. Ready for review. ║",
+            "╚═══════════════════════════════════╝",
+            "",
+        ]
+
+    def test_escalation(self, quiet_runner, console):
+        quiet_runner.consecutive_failures = quiet_runner.config.max_consecutive_failures - 1
+        with console.capture() as capture:
+            assert quiet_runner._handle_exit_code(1, 1, None, None) is False
+        lines = [line.rstrip() for line in capture.get().split("\n")]
+        assert lines[0] == ""
+        assert lines[2].startswith("║ ⚠️  ESCALATION REQUIRED")
+        assert lines[3] == (
+            f"║ {quiet_runner.config.max_consecutive_failures} consecutive failures. "
+            "Human intervention needed. ║"
+        )
+        assert lines[-2:] == ["╚" + "═" * (len(lines[3]) - 2) + "╝", ""]
+
+    def test_stop_file(self, quiet_runner, console, tmp_path):
+        (tmp_path / "stop.txt").touch()
+        with console.capture() as capture:
+            assert quiet_runner._check_stop_file() is True
+        assert [line.rstrip() for line in capture.get().split("\n")] == render(
+            console, runner_module._STOP_BANNER
+        )
+        assert not (tmp_path / "stop.txt").exists()